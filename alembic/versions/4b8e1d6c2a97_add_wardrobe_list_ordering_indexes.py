@@ -0,0 +1,35 @@
+"""add wardrobe list ordering indexes
+
+Revision ID: 4b8e1d6c2a97
+Revises: 7c4e2b9a1f35
+Create Date: 2026-10-16 14:03:27.118460
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b8e1d6c2a97'
+down_revision: Union[str, Sequence[str], None] = '7c4e2b9a1f35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The wardrobe list orders and pages by id, so the list indexes end in id.
+    # CONCURRENTLY avoids locking writes to wardrobe_items while the indexes build;
+    # it can't run inside a transaction, hence the autocommit block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_wardrobe_items_user_id_id', 'wardrobe_items', ['user_id', 'id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_wardrobe_items_user_category_status_id', 'wardrobe_items', ['user_id', 'category', 'status', 'id'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_wardrobe_items_user_category_status_id', table_name='wardrobe_items', postgresql_concurrently=True)
+        op.drop_index('ix_wardrobe_items_user_id_id', table_name='wardrobe_items', postgresql_concurrently=True)
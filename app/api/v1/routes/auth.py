@@ -7,8 +7,9 @@ from workos.exceptions import BadRequestException, EmailVerificationRequiredExce
 from app.api.v1.schemas.auth import AuthorizationRequest, AuthorizationUrlResponse, EmailVerificationRequiredResponse, ForgotPasswordRequest, ForgotPasswordResponse, LoginRequest, LoginResponse, LogoutRequest, LogoutResponse, OAuthCallbackRequest, RefreshTokenRequest, RefreshTokenResponse, ResetPasswordRequest, SignupRequest, SignupResponse, VerifyEmailRequest, VerifyEmailResponse, WorkOSAuthorizationRequest, WorkOSLoginRequest, WorkOSRefreshTokenRequest, WorkOSResetPasswordRequest, WorkOsVerifyEmailRequest
 from app.api.v1.schemas.user import AuthUserResponse
 from app.core.config import settings
-from app.core.database import get_db
+from app.core.database import get_db, is_unique_violation
 from app.core.dependencies import get_auth_service, get_current_user
+from app.core.exceptions import AlreadyExistsException
 import logging
 
 logger = logging.getLogger(__name__)
@@ -79,12 +80,16 @@ async def signup(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Failed to create account: {e.message if hasattr(e, 'message') else str(e)}"
         )
+    except AlreadyExistsException as e:
+        logger.warning(f"Duplicate email during signup: {signup_request.email}")
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="An account with this email address already exists. Please try logging in or resetting your password."
+        ) from e
     except IntegrityError as e:
-        # Handle database integrity errors (e.g., duplicate email)
-        error_str = str(e.orig) if hasattr(e, 'orig') else str(e)
-        
+        # Handle database integrity errors (e.g., duplicate email from a concurrent signup)
         # Check if it's a duplicate email constraint violation
-        if "ix_users_email" in error_str or "duplicate key" in error_str.lower() or "unique constraint" in error_str.lower():
+        if is_unique_violation(e):
             logger.warning(f"Duplicate email during signup: {signup_request.email}")
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
@@ -3,21 +3,31 @@ Image upload routes
 Handles image uploads to S3 storage
 """
 
+import asyncio
 import logging
 import time
-from pathlib import Path
+from typing import List
 
 from botocore.exceptions import ClientError
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
 
 from app.api.v1.schemas.auth import WorkOSUserResponse
-from app.api.v1.schemas.storage import ImageUploadResponse, PresignedUploadResponse
+from app.api.v1.schemas.storage import ImageUploadResponse, PresignedBatchRequest, PresignedUploadResponse
 from app.core.config import settings
 from app.core.dependencies import get_current_user
+from app.core.responses import ORJSONResponse
 from app.services.storage import get_storage_service
 
 logger = logging.getLogger(__name__)
 
+# Maximum accepted upload size (5MB) and the chunk size used to enforce it while reading
+MAX_FILE_SIZE = 5 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Upload timing breakdown is only logged in development; settings don't change at
+# runtime, so resolve the check once instead of on every branch of every upload
+_DEV_LOG = settings.ENVIRONMENT == "development"
+
 router = APIRouter(
     prefix="/images",
     tags=["images"],
@@ -27,6 +37,7 @@ router = APIRouter(
 @router.post(
     "/presigned-url",
     response_model=PresignedUploadResponse,
+    response_class=ORJSONResponse,
     summary="Get presigned URL for upload",
     description="Get a presigned URL that allows direct client-to-S3 upload. This bypasses the server for faster uploads.",
     status_code=status.HTTP_200_OK,
@@ -51,7 +62,7 @@ async def get_presigned_upload_url(
         description="URL expiration time in seconds (60-3600, default: 3600 = 1 hour)",
     ),
     current_user: WorkOSUserResponse = Depends(get_current_user),
-) -> PresignedUploadResponse:
+) -> ORJSONResponse:
     """
     Generate a presigned URL for direct client-to-S3 image upload.
 
@@ -92,7 +103,8 @@ async def get_presigned_upload_url(
         current_user: Authenticated user (from JWT token)
 
     Returns:
-        PresignedUploadResponse with presigned URL and public URL
+        PresignedUploadResponse JSON with presigned URL and public URL, serialized
+        with orjson (response_model is kept for the OpenAPI schema only)
     """
     # Get singleton storage service (cached via lru_cache)
     storage_service = get_storage_service()
@@ -107,11 +119,13 @@ async def get_presigned_upload_url(
             folder=folder, file_extension=normalized_extension, expiration=expiration
         )
 
-        return PresignedUploadResponse(
-            url=result["url"],
-            key=result["key"],
-            public_url=result["public_url"],
-            expires_in=expiration,
+        return ORJSONResponse(
+            content={
+                "url": result["url"],
+                "key": result["key"],
+                "public_url": result["public_url"],
+                "expires_in": expiration,
+            }
         )
 
     except ValueError as e:
@@ -138,6 +152,88 @@ async def get_presigned_upload_url(
         ) from e
 
 
+@router.post(
+    "/presigned-urls",
+    response_model=List[PresignedUploadResponse],
+    response_class=ORJSONResponse,
+    summary="Get presigned URLs for several uploads",
+    description="Get presigned URLs for up to 100 direct client-to-S3 uploads in a single request.",
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"description": "Presigned URLs generated successfully"},
+        401: {"description": "Unauthorized - authentication required"},
+        422: {"description": "Validation error - empty batch, too many items, or invalid expiration"},
+        500: {"description": "Internal server error"},
+    },
+)
+async def get_presigned_upload_urls(
+    payload: PresignedBatchRequest,
+    current_user: WorkOSUserResponse = Depends(get_current_user),
+) -> ORJSONResponse:
+    """
+    Generate presigned URLs for several direct client-to-S3 uploads at once.
+
+    Batch counterpart of `POST /images/presigned-url` for clients that upload
+    many images together (e.g., a wardrobe import). Results are returned in the
+    same order as `items` and all share the same `expiration`.
+
+    Args:
+        payload: Items to sign (folder + file extension each) and expiration
+        current_user: Authenticated user (from JWT token)
+
+    Returns:
+        List of PresignedUploadResponse JSON objects, one per requested item
+        (serialized with orjson, as above)
+    """
+    storage_service = get_storage_service()
+
+    # Normalize file extensions (remove leading dot if present), same as the single endpoint
+    items = [(item.folder, item.file_extension.lstrip(".")) for item in payload.items]
+
+    try:
+        # Signing is CPU-only but up to 100 HMACs shouldn't run on the event loop
+        results = await asyncio.to_thread(
+            storage_service.generate_presigned_upload_urls,
+            items,
+            payload.expiration,
+        )
+
+        # Plain dicts, no response model instances: every value comes straight from
+        # the storage service (str URLs/keys) or the already-validated payload
+        return ORJSONResponse(
+            content=[
+                {
+                    "url": result["url"],
+                    "key": result["key"],
+                    "public_url": result["public_url"],
+                    "expires_in": payload.expiration,
+                }
+                for result in results
+            ]
+        )
+
+    except ValueError as e:
+        logger.warning(f"Batch presigned URL generation failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
+    except ClientError as e:
+        logger.error(f"S3 error generating presigned URLs: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to generate presigned URLs due to a server error",
+        ) from e
+    except Exception as e:
+        logger.error(
+            f"Unexpected error generating presigned URLs for user {current_user.id}: {type(e).__name__}: {e}",
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred while generating presigned URLs",
+        ) from e
+
+
 @router.post(
     "/upload",
     response_model=ImageUploadResponse,
@@ -146,8 +242,9 @@ async def get_presigned_upload_url(
     status_code=status.HTTP_200_OK,
     responses={
         200: {"description": "Image uploaded successfully"},
-        400: {"description": "Invalid file format or size"},
+        400: {"description": "Invalid file format or empty file"},
         401: {"description": "Unauthorized - authentication required"},
+        413: {"description": "File exceeds the 5MB size limit"},
         500: {"description": "Internal server error"},
     },
 )
@@ -181,13 +278,14 @@ async def upload_image(
 
     Raises:
         HTTPException:
-            - 400 if file format is invalid or file is too large
+            - 400 if file format is invalid or file is empty
             - 401 if not authenticated
+            - 413 if file is larger than 5MB
             - 500 for upload failures
     """
     start_time = time.time()
-    if settings.ENVIRONMENT == "development":
-        logger.info(f"[DEBUG] Image upload started at {start_time:.3f}")
+    if _DEV_LOG:
+        logger.info("[DEBUG] Image upload started at %.3f", start_time)
 
     # Validate file type (JPG only)
     if not file.filename:
@@ -195,35 +293,48 @@ async def upload_image(
             status_code=status.HTTP_400_BAD_REQUEST, detail="No file provided"
         )
 
-    # Check file extension
-    file_extension = Path(file.filename).suffix.lower()
-    if file_extension not in [".jpg", ".jpeg"]:
+    # Check file extension (plain string slice, no Path object needed per request)
+    dot = file.filename.rfind(".")
+    file_extension = file.filename[dot + 1 :].lower() if dot >= 0 else ""
+    if file_extension not in ("jpg", "jpeg"):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Only JPG/JPEG files are allowed",
         )
 
     validation_time = time.time()
-    if settings.ENVIRONMENT == "development":
+    if _DEV_LOG:
         logger.info(
-            f"[DEBUG] Validation took {(validation_time - start_time) * 1000:.2f}ms"
+            "[DEBUG] Validation took %.2fms", (validation_time - start_time) * 1000
         )
 
     # Validate file size (max 5MB for small files)
-    MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
+    # Read in chunks and bail out as soon as the running total crosses the limit,
+    # so an oversized upload is never copied into memory in full
     read_start = time.time()
-    file_content = await file.read()
-    read_time = time.time()
-    if settings.ENVIRONMENT == "development":
-        logger.info(
-            f"[DEBUG] File read took {(read_time - read_start) * 1000:.2f}ms, size: {len(file_content)} bytes"
-        )
-
-    if len(file_content) > MAX_FILE_SIZE:
+    if file.size is not None and file.size > MAX_FILE_SIZE:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
             detail=f"File size exceeds maximum allowed size of {MAX_FILE_SIZE / (1024*1024):.1f}MB",
         )
+    total_size = 0
+    chunks = []
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        total_size += len(chunk)
+        if total_size > MAX_FILE_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"File size exceeds maximum allowed size of {MAX_FILE_SIZE / (1024*1024):.1f}MB",
+            )
+        chunks.append(chunk)
+    file_content = b"".join(chunks)
+    read_time = time.time()
+    if _DEV_LOG:
+        logger.info(
+            "[DEBUG] File read took %.2fms, size: %s bytes",
+            (read_time - read_start) * 1000,
+            len(file_content),
+        )
 
     if not file_content:
         raise HTTPException(
@@ -231,40 +342,39 @@ async def upload_image(
         )
 
     before_service_time = time.time()
-    if settings.ENVIRONMENT == "development":
+    if _DEV_LOG:
         logger.info(
-            f"[DEBUG] Time before StorageService get: {(before_service_time - start_time) * 1000:.2f}ms"
+            "[DEBUG] Time before StorageService get: %.2fms",
+            (before_service_time - start_time) * 1000,
         )
 
     storage_service = get_storage_service()
 
     service_get_time = time.time()
-    if settings.ENVIRONMENT == "development":
+    if _DEV_LOG:
         logger.info(
-            f"[DEBUG] StorageService get took {(service_get_time - before_service_time) * 1000:.2f}ms"
+            "[DEBUG] StorageService get took %.2fms",
+            (service_get_time - before_service_time) * 1000,
         )
 
-    # Normalize extension: .jpeg -> jpeg, .jpg -> jpg (remove leading dot)
-    normalized_extension = file_extension.lstrip(".")
-
     try:
         # Upload to S3 - pass content directly to avoid reading twice
         upload_start = time.time()
-        if settings.ENVIRONMENT == "development":
-            logger.info(f"[DEBUG] Starting S3 upload at {upload_start:.3f}")
+        if _DEV_LOG:
+            logger.info("[DEBUG] Starting S3 upload at %.3f", upload_start)
         url = await storage_service.upload_image(
             file_content=file_content,
             folder=folder,
-            file_extension=normalized_extension,
+            file_extension=file_extension,
         )
         upload_end = time.time()
         upload_duration = (upload_end - upload_start) * 1000
-        if settings.ENVIRONMENT == "development":
-            logger.info(f"[DEBUG] S3 upload completed in {upload_duration:.2f}ms")
+        if _DEV_LOG:
+            logger.info("[DEBUG] S3 upload completed in %.2fms", upload_duration)
 
         total_time = (upload_end - start_time) * 1000
-        if settings.ENVIRONMENT == "development":
-            logger.info(f"[DEBUG] Total upload time: {total_time:.2f}ms")
+        if _DEV_LOG:
+            logger.info("[DEBUG] Total upload time: %.2fms", total_time)
         logger.info(
             f"Image uploaded successfully by user {current_user.id}: {url} (took {total_time:.2f}ms)"
         )
@@ -3,15 +3,24 @@ Task API routes
 CRUD endpoints for task management
 Reference: https://fastapi.tiangolo.com/tutorial/sql-databases/
 """
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import Any, AsyncIterator, Dict, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.responses import ORJSONResponse, conditional_json_response, dump_json
 from app.api.v1.schemas.task import TaskCreate, TaskUpdate, TaskResponse
+from app.models.task import Task
 from app.services.task import TaskService
 
 
+# Static 404 detail - the task ID is already in the request path, so there's
+# nothing to format per miss. The HTTPException itself is still created per raise:
+# a shared instance would keep the last request's traceback (and the frames and
+# session it references) alive, and concurrent raises would overwrite its __traceback__.
+TASK_NOT_FOUND_DETAIL = "Task not found"
+
 # Create router for task endpoints
 router = APIRouter(
     prefix="/tasks",
@@ -23,55 +32,124 @@ router = APIRouter(
 )
 
 
+def _task_to_dict(task: Task) -> Dict[str, Any]:
+    """Build the TaskResponse payload for a task straight from the ORM row."""
+    return {
+        "title": task.title,
+        "description": task.description,
+        "completed": task.completed,
+        "id": task.id,
+        "created_at": task.created_at,
+        "updated_at": task.updated_at,
+    }
+
+
 @router.get(
     "",
     response_model=List[TaskResponse],
+    response_class=ORJSONResponse,
     summary="List tasks",
     description="Retrieve a list of tasks with optional filtering and pagination",
     status_code=status.HTTP_200_OK
 )
 async def get_tasks(
-    skip: int = Query(0, ge=0, description="Number of tasks to skip"),
+    skip: int = Query(0, ge=0, description="Number of tasks to skip (ignored when cursor is set)"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of tasks to return"),
     completed: Optional[bool] = Query(None, description="Filter by completion status"),
+    cursor: Optional[int] = Query(
+        None,
+        ge=1,
+        description="Return tasks older than this task ID (value of X-Next-Cursor from the previous page)"
+    ),
     db: AsyncSession = Depends(get_db)
-) -> List[TaskResponse]:
+) -> ORJSONResponse:
     """
-    Get a list of tasks
+    Get a list of tasks, newest first
     
     Supports:
-    - Pagination via skip and limit parameters
+    - Cursor pagination via cursor and limit parameters (preferred - constant cost per page)
+    - Offset pagination via skip and limit parameters
     - Filtering by completion status
     
+    When a full page is returned, the X-Next-Cursor response header holds the
+    cursor for the next page.
+    
+    Returns:
+        List of tasks, serialized with orjson (response_model is used for the
+        OpenAPI schema only)
+    """
+    tasks = await TaskService.get_tasks(
+        db, skip=skip, limit=limit, completed=completed, before_id=cursor
+    )
+    headers = {"X-Next-Cursor": str(tasks[-1].id)} if len(tasks) == limit else None
+    return ORJSONResponse(content=[_task_to_dict(task) for task in tasks], headers=headers)
+
+
+# Declared before /{task_id} so "stream" isn't parsed as a task ID
+@router.get(
+    "/stream",
+    response_model=List[TaskResponse],
+    response_class=StreamingResponse,
+    summary="Stream all tasks",
+    description="Stream every task (newest first) as a JSON array without loading them all into memory",
+    status_code=status.HTTP_200_OK
+)
+async def stream_tasks(
+    completed: Optional[bool] = Query(None, description="Filter by completion status"),
+    db: AsyncSession = Depends(get_db)
+) -> StreamingResponse:
+    """
+    Stream all tasks as a single JSON array
+    
+    Rows are read from a server-side cursor in batches and each batch is
+    encoded and sent as soon as it arrives, so memory use stays flat no
+    matter how many tasks there are. Use this instead of paging through
+    GET /tasks for exports.
+    
     Returns:
-        List of TaskResponse objects
+        JSON array of TaskResponse objects
     """
-    tasks = await TaskService.get_tasks(db, skip=skip, limit=limit, completed=completed)
-    return tasks
+    async def encode_tasks() -> AsyncIterator[bytes]:
+        yield b"["
+        first = True
+        async for batch in TaskService.stream_tasks(db, completed=completed):
+            chunk = b",".join(dump_json(_task_to_dict(task)) for task in batch)
+            yield chunk if first else b"," + chunk
+            first = False
+        yield b"]"
+    
+    return StreamingResponse(encode_tasks(), media_type="application/json")
 
 
 @router.get(
     "/{task_id}",
     response_model=TaskResponse,
+    response_class=ORJSONResponse,
     summary="Get task by ID",
     description="Retrieve a single task by its ID",
     status_code=status.HTTP_200_OK,
     responses={
+        304: {"description": "Task unchanged since the ETag sent in If-None-Match"},
         404: {"description": "Task not found"}
     }
 )
 async def get_task(
     task_id: int,
+    request: Request,
     db: AsyncSession = Depends(get_db)
-) -> TaskResponse:
+) -> Response:
     """
     Get a single task by ID
     
+    Responses carry an ETag; sending it back in If-None-Match returns an empty
+    304 when the task hasn't changed.
+    
     Args:
         task_id: ID of the task to retrieve
+        request: Current request (for If-None-Match)
         
     Returns:
-        TaskResponse object
+        TaskResponse JSON, or 304 Not Modified
         
     Raises:
         HTTPException: If task is not found
@@ -80,9 +158,9 @@ async def get_task(
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Task with ID {task_id} not found"
+            detail=TASK_NOT_FOUND_DETAIL
         )
-    return task
+    return conditional_json_response(request, dump_json(_task_to_dict(task)))
 
 
 @router.post(
@@ -144,7 +222,7 @@ async def update_task(
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Task with ID {task_id} not found"
+            detail=TASK_NOT_FOUND_DETAIL
         )
     return task
 
@@ -162,13 +240,16 @@ async def update_task(
 async def delete_task(
     task_id: int,
     db: AsyncSession = Depends(get_db)
-):
+) -> Response:
     """
     Delete a task
     
     Args:
         task_id: ID of the task to delete
         
+    Returns:
+        Empty 204 No Content response
+        
     Raises:
         HTTPException: If task is not found
     """
@@ -176,7 +257,7 @@ async def delete_task(
     if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Task with ID {task_id} not found"
+            detail=TASK_NOT_FOUND_DETAIL
         )
-    return None  # 204 No Content
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
@@ -1,15 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.exc import IntegrityError
 from workos.exceptions import BadRequestException
+from app.api.v1.routes.wardrobe import wardrobe_list_cache_key
 from app.api.v1.schemas.auth import WorkOSUserResponse
-from app.api.v1.schemas.user import UserProfileCreate, UserProfileResponse, UserProfileUpdate, UserResponse, UserUpdate
+from app.api.v1.schemas.user import UserProfileCreate, UserProfileResponse, UserMeResponse, UserProfileUpdate, UserResponse, UserUpdate
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.cache import get_cached_json, invalidate_cache, set_cached_json, singleflight
+from app.core.database import TRANSIENT_DB_ERRORS, get_db
 # from app.core.exceptions import InvalidPasswordException
-from app.core.config import settings
-from app.core.dependencies import get_current_user
-from app.services.user import UserService
+from app.core.exceptions import AlreadyExistsException
+from app.core.dependencies import get_current_user, require_self_user
+from app.core.responses import ORJSONResponse, conditional_json_response
+from app.models.user import User, UserProfile
+from app.services.user import get_user_service
 import logging
 
 logger = logging.getLogger(__name__)
@@ -19,34 +25,87 @@ router = APIRouter(
     tags=["user"],
 )
 
+# Profiles change rarely but are read on almost every screen - cache the serialized
+# response in Redis. Create/update write the new response through to the cache and
+# delete drops it, each only after committing so the cache never holds a rolled-back write
+PROFILE_CACHE_TTL = 300  # 5 minutes in seconds
+# Clients may reuse a fetched profile for 30s before revalidating with its ETag
+PROFILE_CACHE_CONTROL = "private, max-age=30, must-revalidate"
+
+
+def _profile_cache_key(user_id: str) -> str:
+    """Redis key for a user's cached profile response."""
+    return f"user:{user_id}:profile"
+
+
+def _profile_json(user_profile: UserProfile) -> bytes:
+    """Serialize a profile row to UserProfileResponse JSON via model_construct() (no re-validation)."""
+    return UserProfileResponse.model_construct(
+        **{name: getattr(user_profile, name) for name in UserProfileResponse.model_fields}
+    ).model_dump_json().encode()
+
+
+def _user_json(user: User) -> bytes:
+    """Serialize a user row to UserResponse JSON via model_construct() (no re-validation)."""
+    return UserResponse.model_construct(
+        **{name: getattr(user, name) for name in UserResponse.model_fields}
+    ).model_dump_json().encode()
+
+
+# Per-worker cache of serialized GET /user/{user_id} responses
+# Short TTL keeps other workers' copies fresh enough after an update/delete;
+# this worker's copy is dropped immediately by the update/delete routes
+# Reference: https://cachetools.readthedocs.io/en/stable/#cachetools.TTLCache
+USER_RESPONSE_CACHE_TTL = 30  # seconds
+USER_RESPONSE_CACHE_MAX_SIZE = 4096
+_user_response_cache: TTLCache[str, bytes] = TTLCache(
+    maxsize=USER_RESPONSE_CACHE_MAX_SIZE, ttl=USER_RESPONSE_CACHE_TTL
+)
+
+# Error responses shared by the route decorators below (OpenAPI docs only)
+_COMMON_ERRORS = {
+    401: {"description": "Unauthorized - authentication required"},
+    500: {"description": "Internal server error"},
+}
+_PROFILE_ERRORS = _COMMON_ERRORS | {404: {"description": "User profile not found"}}
+_USER_ERRORS = _COMMON_ERRORS | {404: {"description": "User not found"}}
+_VALIDATION_ERROR = {400: {"description": "Invalid request data or validation error"}}
+
 # IMPORTANT: Profile routes must come BEFORE /{user_id} route
 # Otherwise FastAPI will match /profile as user_id="profile"
 @router.get(
     "/profile",
     response_model=UserProfileResponse,
+    response_class=ORJSONResponse,
     summary="Get user profile",
     description="Get the user profile for the authenticated user.",
     status_code=status.HTTP_200_OK,
-    responses={
+    responses=_PROFILE_ERRORS | {
         200: {"description": "Profile retrieved successfully"},
-        401: {"description": "Unauthorized - authentication required"},
-        404: {"description": "User profile not found"},
-        500: {"description": "Internal server error"}
+        304: {"description": "Profile unchanged since the ETag sent in If-None-Match"},
     }
 )
 async def get_user_profile(
+    request: Request,
     current_user: WorkOSUserResponse = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
-) -> UserProfileResponse:
+) -> Response:
     """
     Get the user profile for the authenticated user.
     
+    Served from Redis when cached (PROFILE_CACHE_TTL), so cache hits never open
+    a database connection. Missing profiles (404) are not cached.
+    
+    Responses carry an ETag; sending it back in If-None-Match returns an empty
+    304 when the profile hasn't changed.
+    
     Args:
+        request: Current request (for If-None-Match)
         current_user: Authenticated user (from JWT token)
         db: Database session
         
     Returns:
-        UserProfileResponse object
+        UserProfileResponse JSON, or 304 Not Modified
         
     Raises:
         HTTPException:
@@ -54,40 +113,40 @@ async def get_user_profile(
             - 404 if profile not found
             - 500 for unexpected errors
     """
-    # Debug logging (only in development)
-    if settings.ENVIRONMENT == "development":
-        logger.debug("=" * 80)
-        logger.debug("GET /api/v1/user/profile - FUNCTION CALLED")
-        logger.debug("Getting profile for authenticated user:")
-        logger.debug(f"  - current_user.id: '{current_user.id}' (type: {type(current_user.id)}, length: {len(current_user.id)})")
-        logger.debug(f"  - current_user.email: '{current_user.email}'")
-    
-    user_service = UserService()
-    try:
+    cache_key = _profile_cache_key(current_user.id)
+    cached_profile = await get_cached_json(cache_key)
+    if cached_profile is not None:
+        return conditional_json_response(request, cached_profile, PROFILE_CACHE_CONTROL)
+
+    user_service = get_user_service()
+
+    async def load_profile() -> Optional[bytes]:
         user_profile = await user_service.get_user_profile(db, current_user.id)
         if not user_profile:
-            if settings.ENVIRONMENT == "development":
-                logger.debug(f"Profile not found for user_id: '{current_user.id}'")
-                logger.debug("GET /api/v1/user/profile - END (404)")
-                logger.debug("=" * 80)
-            logger.warning(f"Profile not found for user_id: {current_user.id}")
+            return None
+        payload = _profile_json(user_profile)
+        await set_cached_json(cache_key, payload, PROFILE_CACHE_TTL)
+        return payload
+
+    try:
+        # Concurrent misses for the same user share one database load
+        payload = await singleflight(cache_key, load_profile)
+        if payload is None:
+            logger.warning("Profile not found for user_id: %s", current_user.id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User profile not found"
             )
-        if settings.ENVIRONMENT == "development":
-            logger.debug(f"Profile retrieved successfully for user: '{current_user.id}'")
-            logger.debug("GET /api/v1/user/profile - END (200)")
-            logger.debug("=" * 80)
-        logger.info(f"Profile retrieved successfully for user: {current_user.id}")
-        return user_profile
+        logger.info("Profile retrieved successfully for user: %s", current_user.id)
+        return conditional_json_response(request, payload, PROFILE_CACHE_CONTROL)
     except HTTPException:
         # Re-raise HTTP exceptions (like 404) without wrapping
         raise
     except Exception as e:
         logger.error(
-            f"Unexpected error getting profile for user {current_user.id}: {type(e).__name__}: {e}",
-            exc_info=True
+            "Unexpected error getting profile for user %s: %s: %s",
+            current_user.id, type(e).__name__, e,
+            exc_info=not isinstance(e, TRANSIENT_DB_ERRORS)
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -97,22 +156,19 @@ async def get_user_profile(
 @router.post(
     "/profile",
     response_model=UserProfileResponse,
+    response_class=ORJSONResponse,
     summary="Create user profile",
     status_code=status.HTTP_201_CREATED,
-    responses={
+    responses=_USER_ERRORS | _VALIDATION_ERROR | {
         201: {"description": "Profile created successfully"},
-        400: {"description": "Invalid request data or validation error"},
-        401: {"description": "Unauthorized - authentication required"},
-        404: {"description": "User not found"},
         409: {"description": "Profile already exists for this user"},
-        500: {"description": "Internal server error"}
     }
 )
 async def create_user_profile(
     user_profile_data: UserProfileCreate,
     current_user: WorkOSUserResponse = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
-) -> UserProfileResponse:
+) -> ORJSONResponse:
     """
     Create a user profile for the authenticated user.
     
@@ -134,7 +190,7 @@ async def create_user_profile(
             - 409 if profile already exists
             - 500 for unexpected errors
     """
-    user_service = UserService()
+    user_service = get_user_service()
     try:
         # Create profile for the authenticated user (current_user.id)
         user_profile = await user_service.create_user_profile(
@@ -142,25 +198,27 @@ async def create_user_profile(
             current_user.id, 
             user_profile_data
         )
-        logger.info(f"Profile created successfully for user: {current_user.id}")
-        return user_profile
+        payload = _profile_json(user_profile)
+        await db.commit()
+        await set_cached_json(_profile_cache_key(current_user.id), payload, PROFILE_CACHE_TTL)
+        logger.info("Profile created successfully for user: %s", current_user.id)
+        return ORJSONResponse(content=payload, status_code=status.HTTP_201_CREATED)
     except ValueError as e:
-        logger.warning(f"Profile creation failed - user not found: {current_user.id}")
+        logger.warning("Profile creation failed - user not found: %s", current_user.id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         ) from e
+    except AlreadyExistsException as e:
+        logger.warning("Profile already exists for user: %s", current_user.id)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A profile already exists for this user. Use PATCH to update it instead."
+        ) from e
     except IntegrityError as e:
-        # Profile already exists (unique constraint violation)
-        error_str = str(e.orig) if hasattr(e, 'orig') else str(e)
-        if "uq_user_profiles_user_id" in error_str or "unique constraint" in error_str.lower():
-            logger.warning(f"Profile already exists for user: {current_user.id}")
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="A profile already exists for this user. Use PATCH to update it instead."
-            ) from e
-        # Other integrity errors (e.g., foreign key violation)
-        logger.error(f"Database integrity error creating profile: {e}", exc_info=True)
+        # Duplicates (AlreadyExistsException) and a missing user (ValueError) are
+        # reported by the service, so this is some other constraint violation
+        logger.error("Database integrity error creating profile: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Failed to create profile due to a data conflict"
@@ -168,8 +226,9 @@ async def create_user_profile(
     except Exception as e:
         # Unexpected errors
         logger.error(
-            f"Unexpected error creating profile for user {current_user.id}: {type(e).__name__}: {e}",
-            exc_info=True
+            "Unexpected error creating profile for user %s: %s: %s",
+            current_user.id, type(e).__name__, e,
+            exc_info=not isinstance(e, TRANSIENT_DB_ERRORS)
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -179,22 +238,19 @@ async def create_user_profile(
 @router.patch(
     "/profile",
     response_model=UserProfileResponse,
+    response_class=ORJSONResponse,
     summary="Update user profile",
     description="Update the user profile for the authenticated user. All fields are optional for partial updates.",
     status_code=status.HTTP_200_OK,
-    responses={
+    responses=_PROFILE_ERRORS | _VALIDATION_ERROR | {
         200: {"description": "Profile updated successfully"},
-        400: {"description": "Invalid request data or validation error"},
-        401: {"description": "Unauthorized - authentication required"},
-        404: {"description": "User profile not found"},
-        500: {"description": "Internal server error"}
     }
 )
 async def update_user_profile(
     user_profile_data: UserProfileUpdate,
     current_user: WorkOSUserResponse = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
-) -> UserProfileResponse:
+) -> ORJSONResponse:
     """
     Update the user profile for the authenticated user.
     
@@ -215,7 +271,7 @@ async def update_user_profile(
             - 400 for validation errors
             - 500 for unexpected errors
     """
-    user_service = UserService()
+    user_service = get_user_service()
     try:
         user_profile = await user_service.update_user_profile(
             db, 
@@ -227,16 +283,20 @@ async def update_user_profile(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User profile not found"
             )
-        logger.info(f"Profile updated successfully for user: {current_user.id}")
-        return user_profile
+        payload = _profile_json(user_profile)
+        await db.commit()
+        await set_cached_json(_profile_cache_key(current_user.id), payload, PROFILE_CACHE_TTL)
+        logger.info("Profile updated successfully for user: %s", current_user.id)
+        return ORJSONResponse(content=payload)
     except HTTPException:
         # Re-raise HTTP exceptions (like 404) without wrapping
         raise
     except Exception as e:
         # Unexpected errors
         logger.error(
-            f"Unexpected error updating profile for user {current_user.id}: {type(e).__name__}: {e}",
-            exc_info=True
+            "Unexpected error updating profile for user %s: %s: %s",
+            current_user.id, type(e).__name__, e,
+            exc_info=not isinstance(e, TRANSIENT_DB_ERRORS)
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -248,17 +308,14 @@ async def update_user_profile(
     summary="Delete user profile",
     description="Delete the user profile for the authenticated user.",
     status_code=status.HTTP_204_NO_CONTENT,
-    responses={
+    responses=_PROFILE_ERRORS | {
         204: {"description": "Profile deleted successfully"},
-        401: {"description": "Unauthorized - authentication required"},
-        404: {"description": "User profile not found"},
-        500: {"description": "Internal server error"}
     }
 )
 async def delete_user_profile(
     current_user: WorkOSUserResponse = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
-) -> None:
+) -> Response:
     """
     Delete the user profile for the authenticated user.
     
@@ -267,7 +324,7 @@ async def delete_user_profile(
         db: Database session
         
     Returns:
-        None (204 No Content)
+        Empty 204 No Content response (returned directly, skipping response encoding)
         
     Raises:
         HTTPException:
@@ -275,7 +332,7 @@ async def delete_user_profile(
             - 404 if profile not found
             - 500 for unexpected errors
     """
-    user_service = UserService()
+    user_service = get_user_service()
     try:
         deleted = await user_service.delete_user_profile(db, current_user.id)
         if not deleted:
@@ -283,15 +340,18 @@ async def delete_user_profile(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User profile not found"
             )
-        logger.info(f"Profile deleted successfully for user: {current_user.id}")
-        return None
+        await db.commit()
+        await invalidate_cache(_profile_cache_key(current_user.id))
+        logger.info("Profile deleted successfully for user: %s", current_user.id)
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
     except HTTPException:
         # Re-raise HTTP exceptions (like 404) without wrapping
         raise
     except Exception as e:
         logger.error(
-            f"Unexpected error deleting profile for user {current_user.id}: {type(e).__name__}: {e}",
-            exc_info=True
+            "Unexpected error deleting profile for user %s: %s: %s",
+            current_user.id, type(e).__name__, e,
+            exc_info=not isinstance(e, TRANSIENT_DB_ERRORS)
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -299,47 +359,127 @@ async def delete_user_profile(
         ) from e
 
 
-@router.get("/{user_id}", response_model=UserResponse)
+@router.get(
+    "/me",
+    response_model=UserMeResponse,
+    response_class=ORJSONResponse,
+    summary="Get current user with profile",
+    description="Get the authenticated user and their profile (null if not created yet) in one request.",
+    status_code=status.HTTP_200_OK,
+    responses=_USER_ERRORS | {
+        200: {"description": "User retrieved successfully"},
+    }
+)
+async def get_me(
+    current_user: WorkOSUserResponse = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+) -> ORJSONResponse:
+    """
+    Get the authenticated user together with their profile.
+    
+    Both rows come from a single joined query. The profile part is also written
+    to the profile cache, so a following GET /user/profile is served from Redis.
+    
+    Args:
+        current_user: Authenticated user (from JWT token)
+        db: Database session
+        
+    Returns:
+        UserMeResponse JSON
+        
+    Raises:
+        HTTPException:
+            - 401 if not authenticated
+            - 404 if user not found
+            - 500 for unexpected errors
+    """
+    user_service = get_user_service()
+    try:
+        user = await user_service.get_user_with_profile(db, current_user.id)
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found"
+            )
+        profile_payload = b"null"
+        if user.profile:
+            profile_payload = _profile_json(user.profile)
+            await set_cached_json(_profile_cache_key(current_user.id), profile_payload, PROFILE_CACHE_TTL)
+        # Splice the already-encoded parts instead of serializing the envelope again
+        return ORJSONResponse(content=b'{"user":' + _user_json(user) + b',"profile":' + profile_payload + b"}")
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(
+            "Unexpected error getting user %s: %s: %s",
+            current_user.id, type(e).__name__, e,
+            exc_info=not isinstance(e, TRANSIENT_DB_ERRORS)
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred while getting the user"
+        ) from e
+
+
+@router.get("/{user_id}", response_model=UserResponse, response_class=ORJSONResponse)
 async def get_user(
     user_id: str,
+    current_user: WorkOSUserResponse = Depends(require_self_user),
     db: AsyncSession = Depends(get_db)
-) -> UserResponse:
+) -> ORJSONResponse:
     """
-    Get a user by ID
+    Get a user by ID (only the authenticated user's own account)
+    
+    Responses are cached in-process for USER_RESPONSE_CACHE_TTL seconds, so
+    repeat lookups skip the database and serialization.
     """
-    user_service = UserService()
+    cached_user = _user_response_cache.get(user_id)
+    if cached_user is not None:
+        return ORJSONResponse(content=cached_user)
+
+    user_service = get_user_service()
     user = await user_service.get_user(db, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
-    return user
+    payload = _user_json(user)
+    _user_response_cache[user_id] = payload
+    return ORJSONResponse(content=payload)
 
 
 @router.patch(
     "/{user_id}",
     response_model=UserResponse,
+    response_class=ORJSONResponse,
     summary="Update user",
     description="Update a user by ID",
-    status_code=status.HTTP_200_OK
+    status_code=status.HTTP_200_OK,
+    responses={
+        404: {"description": "User not found"},
+        401: {"description": "Unauthorized - authentication required"},
+        403: {"description": "Forbidden - not the authenticated user"}
+    }
 )
 async def update_user(
     user_id: str,
     user_data: UserUpdate,
+    current_user: WorkOSUserResponse = Depends(require_self_user),
     db: AsyncSession = Depends(get_db)
-):
+) -> ORJSONResponse:
     """
-    Update a user by ID
+    Update a user by ID (only the authenticated user's own account)
     
     Args:
         user_id: ID of the user to update
         user_data: User update data
+        current_user: Authenticated user, already checked against user_id
         
     Returns:
         Updated UserResponse object
     """
-    user_service = UserService()
+    user_service = get_user_service()
     try:
         user = await user_service.update_user(db, user_id, user_data)
         if not user:
@@ -347,15 +487,25 @@ async def update_user(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
-        return user
+        payload = _user_json(user)
+        await db.commit()
+        _user_response_cache.pop(user_id, None)
+        return ORJSONResponse(content=payload)
+    except HTTPException:
+        # Re-raise HTTP exceptions (like 404) without wrapping
+        raise
     except BadRequestException as e:
-        logger.error(f"Bad request updating user: {e}")
+        logger.error("Bad request updating user: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Failed to update user: {e.message if hasattr(e, 'message') else str(e)}"
         ) from e
     except Exception as e:
-        logger.error(f"Unexpected error updating user: {e}")
+        logger.error(
+            "Unexpected error updating user %s: %s: %s",
+            user_id, type(e).__name__, e,
+            exc_info=not isinstance(e, TRANSIENT_DB_ERRORS)
+        )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred while updating the user"
@@ -368,23 +518,27 @@ async def update_user(
     status_code=status.HTTP_204_NO_CONTENT,
     responses={
         404: {"description": "User not found"},
-        204: {"description": "User deleted successfully"}
+        204: {"description": "User deleted successfully"},
+        401: {"description": "Unauthorized - authentication required"},
+        403: {"description": "Forbidden - not the authenticated user"}
     }
 )
 async def delete_user(
     user_id: str,
+    current_user: WorkOSUserResponse = Depends(require_self_user),
     db: AsyncSession = Depends(get_db)
-):
+) -> Response:
     """
-    Delete a user by ID
+    Delete a user by ID (only the authenticated user's own account)
     
     Args:
         user_id: ID of the user to delete
+        current_user: Authenticated user, already checked against user_id
         
     Returns:
-        None
+        Empty 204 No Content response
     """
-    user_service = UserService()
+    user_service = get_user_service()
     try:
         deleted = await user_service.delete_user(db, user_id)
         if not deleted:
@@ -392,9 +546,22 @@ async def delete_user(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
-        return None 
+        await db.commit()
+        _user_response_cache.pop(user_id, None)
+        # The delete cascades to the profile and wardrobe rows; the caller stays
+        # authenticated via the token/user caches, so drop their Redis copies too
+        await invalidate_cache(_profile_cache_key(user_id))
+        await invalidate_cache(wardrobe_list_cache_key(user_id))
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+    except HTTPException:
+        # Re-raise HTTP exceptions (like 404) without wrapping
+        raise
     except Exception as e:
-        logger.error(f"Unexpected error deleting user: {e}")
+        logger.error(
+            "Unexpected error deleting user %s: %s: %s",
+            user_id, type(e).__name__, e,
+            exc_info=not isinstance(e, TRANSIENT_DB_ERRORS)
+        )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred while deleting the user"
@@ -1,10 +1,12 @@
 """
 Routes for virtual try-on sessions.
 """
+import hashlib
 import logging
-from typing import List
+from typing import Any, Dict, List, Optional, Sequence
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.schemas.auth import WorkOSUserResponse
@@ -14,15 +16,57 @@ from app.api.v1.schemas.virtual_try_on import (
 )
 from app.core.database import get_db
 from app.core.dependencies import get_current_user
-from app.services.virtual_try_on import VirtualTryOnService
+from app.core.responses import (
+    ORJSONResponse,
+    conditional_json_response,
+    dump_json,
+    not_modified_response,
+)
+from app.models.virtual_try_on import VirtualTryOn
+from app.services.virtual_try_on import get_virtual_try_on_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/virtual-try-on", tags=["virtual try-on"])
 
+# Client-side reuse windows before revalidating with the ETag; the list is
+# shorter since new sessions are added often
+SESSION_CACHE_CONTROL = "private, max-age=30, must-revalidate"
+SESSION_LIST_CACHE_CONTROL = "private, max-age=10, must-revalidate"
+
+
+def _session_to_dict(session: VirtualTryOn) -> Dict[str, Any]:
+    """Build the VirtualTryOnResponse payload for a session straight from the ORM row."""
+
+    return {
+        "full_body_image_uri": session.full_body_image_uri,
+        "generated_image_uri": session.generated_image_uri,
+        "use_clean_background": session.use_clean_background,
+        "custom_instructions": session.custom_instructions,
+        "selected_items": session.selected_items,
+        "id": session.id,
+        "user_id": session.user_id,
+        "created_at": session.created_at,
+        "updated_at": session.updated_at,
+    }
+
+
+def _sessions_etag(sessions: Sequence[RowMapping]) -> str:
+    """
+    Weak ETag for a list of sessions, built from each row's ID and updated_at.
+
+    Lets the list endpoint answer 304 without encoding any row or hashing the body.
+    """
+
+    digest = hashlib.blake2b(digest_size=16)
+    for session in sessions:
+        digest.update(f"{session['id']}:{session['updated_at'].isoformat()};".encode())
+    return f'W/"{digest.hexdigest()}"'
+
 
 @router.post(
     "",
     response_model=VirtualTryOnResponse,
+    response_class=ORJSONResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Create a virtual try-on session",
     description="Persist a virtual try-on result so users can revisit generated outfits.",
@@ -31,50 +75,116 @@ async def create_virtual_try_on_session(
     payload: VirtualTryOnCreate,
     current_user: WorkOSUserResponse = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> VirtualTryOnResponse:
+) -> ORJSONResponse:
     """Create a new virtual try-on session."""
 
-    service = VirtualTryOnService()
+    service = get_virtual_try_on_service()
     session = await service.create_session(db, current_user.id, payload)
-    return session
+    return ORJSONResponse(content=_session_to_dict(session), status_code=status.HTTP_201_CREATED)
+
+
+# Upper bound on sessions accepted by one bulk request
+MAX_BULK_SESSIONS = 50
+
+
+@router.post(
+    "/bulk",
+    response_model=List[VirtualTryOnResponse],
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create several virtual try-on sessions",
+    description="Persist a batch of try-on results in one request and one database roundtrip.",
+)
+async def create_virtual_try_on_sessions_bulk(
+    payloads: List[VirtualTryOnCreate] = Body(..., min_length=1, max_length=MAX_BULK_SESSIONS),
+    current_user: WorkOSUserResponse = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> ORJSONResponse:
+    """Create several sessions at once; all are saved or none are."""
+
+    service = get_virtual_try_on_service()
+    sessions = await service.create_sessions_bulk(db, current_user.id, payloads)
+    return ORJSONResponse(
+        content=[dict(session) for session in sessions], status_code=status.HTTP_201_CREATED
+    )
 
 
 @router.get(
     "",
     response_model=List[VirtualTryOnResponse],
+    response_class=ORJSONResponse,
     summary="List virtual try-on sessions",
     description="Fetch recent virtual try-on sessions for the authenticated user.",
+    responses={304: {"description": "Sessions unchanged since the ETag sent in If-None-Match"}},
 )
 async def list_virtual_try_on_sessions(
+    request: Request,
     limit: int = Query(50, ge=1, le=100, description="Maximum number of sessions to return"),
+    cursor: Optional[int] = Query(
+        None,
+        ge=1,
+        description="Return sessions older than this session ID (value of X-Next-Cursor from the previous page)",
+    ),
     current_user: WorkOSUserResponse = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> List[VirtualTryOnResponse]:
-    """Return the most recent sessions."""
+) -> Response:
+    """
+    Return the most recent sessions, newest first.
+
+    When a full page is returned, the X-Next-Cursor response header holds the
+    cursor for the next page.
+
+    Rows are column mappings whose keys are exactly the response fields, so
+    they are encoded with orjson as-is, bypassing per-item pydantic validation
+    and FastAPI's jsonable_encoder. response_model is kept for the OpenAPI
+    schema only.
+
+    A matching If-None-Match gets an empty 304 before any row is encoded.
+    """
 
-    service = VirtualTryOnService()
-    return await service.list_sessions(db, current_user.id, limit=limit)
+    service = get_virtual_try_on_service()
+    sessions = await service.list_sessions(
+        db, current_user.id, limit=limit, before_id=cursor
+    )
+    headers = {
+        "ETag": _sessions_etag(sessions),
+        "Cache-Control": SESSION_LIST_CACHE_CONTROL,
+        "Vary": "Authorization",
+    }
+    if len(sessions) == limit:
+        headers["X-Next-Cursor"] = str(sessions[-1]["id"])
+    not_modified = not_modified_response(request, headers["ETag"], headers)
+    if not_modified is not None:
+        return not_modified
+    return ORJSONResponse(
+        content=dump_json([dict(session) for session in sessions]), headers=headers
+    )
 
 
 @router.get(
     "/{session_id}",
     response_model=VirtualTryOnResponse,
+    response_class=ORJSONResponse,
     summary="Retrieve a virtual try-on session",
     description="Get the details for a single try-on session by ID.",
+    responses={304: {"description": "Session unchanged since the ETag sent in If-None-Match"}},
 )
 async def get_virtual_try_on_session(
+    request: Request,
     session_id: int,
     current_user: WorkOSUserResponse = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> VirtualTryOnResponse:
-    """Retrieve a single session for the current user."""
+) -> Response:
+    """Retrieve a single session for the current user (ETag / If-None-Match aware)."""
 
-    service = VirtualTryOnService()
+    service = get_virtual_try_on_service()
     session = await service.get_session(db, session_id, current_user.id)
     if not session:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Virtual try-on session not found"
         )
-    return session
+    return conditional_json_response(
+        request, dump_json(_session_to_dict(session)), SESSION_CACHE_CONTROL
+    )
 
 
@@ -4,18 +4,22 @@ Handles CRUD operations for wardrobe items
 """
 
 import logging
-from typing import Optional
+import time
+from typing import Any, Dict, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.exc import IntegrityError
+from cachetools import TTLCache
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.schemas.auth import WorkOSUserResponse
 from app.api.v1.schemas.wardrobe import WardrobeCreate, WardrobeResponse, WardrobeUpdate
-from app.core.database import get_db
+from app.core.cache import cached_json_page, invalidate_cache
+from app.core.database import TRANSIENT_DB_ERRORS, get_db
 from app.core.dependencies import get_current_user
-from app.models.wardrobe import ItemStatus
-from app.services.wardrobe import WardrobeService
+from app.core.responses import ORJSONResponse, conditional_json_response, dump_json
+from app.models.wardrobe import ItemStatus, Wardrobe
+from app.services.wardrobe import get_wardrobe_service
 
 logger = logging.getLogger(__name__)
 
@@ -24,20 +28,58 @@ router = APIRouter(
     tags=["wardrobe"],
 )
 
+# How long a cached wardrobe list stays valid if no write invalidates it first
+WARDROBE_LIST_CACHE_TTL = 60
+
+
+# Per-worker cache of serialized GET /wardrobe/{item_id} responses, keyed by (user_id, item_id)
+# Same scheme as the user response cache in user.py; update/delete/mark-worn drop entries
+ITEM_RESPONSE_CACHE_TTL = 30  # seconds
+ITEM_RESPONSE_CACHE_MAX_SIZE = 10_000
+_item_response_cache: TTLCache[Tuple[str, int], bytes] = TTLCache(
+    maxsize=ITEM_RESPONSE_CACHE_MAX_SIZE, ttl=ITEM_RESPONSE_CACHE_TTL
+)
+
+
+def wardrobe_list_cache_key(user_id: str) -> str:
+    """Redis hash holding every cached list variant (filters/pagination) for a user."""
+    return f"wardrobe:list:{user_id}"
+
+
+def _item_to_dict(item: Wardrobe) -> Dict[str, Any]:
+    """Build the WardrobeResponse payload for an item straight from the ORM row."""
+    return {
+        "title": item.title,
+        "category": item.category,
+        "colors": item.colors,
+        "image_url": item.image_url,
+        "tags": item.tags,
+        "status": item.status,
+        "id": item.id,
+        "user_id": item.user_id,
+        "last_worn_at": item.last_worn_at,
+        "wear_count": item.wear_count,
+        "created_at": item.created_at,
+        "updated_at": item.updated_at,
+    }
+
 
 @router.get(
     "",
     response_model=list[WardrobeResponse],
+    response_class=ORJSONResponse,
     summary="Get wardrobe items",
     description="Get all wardrobe items for the authenticated user with optional filtering.",
     status_code=status.HTTP_200_OK,
     responses={
         200: {"description": "Wardrobe items retrieved successfully"},
+        304: {"description": "Items unchanged since the ETag sent in If-None-Match"},
         401: {"description": "Unauthorized - authentication required"},
         500: {"description": "Internal server error"},
     },
 )
 async def get_wardrobe_items(
+    request: Request,
     category: Optional[str] = Query(
         None, description="Filter by category (e.g., 'shirt', 'pants', 'dress')"
     ),
@@ -46,40 +88,63 @@ async def get_wardrobe_items(
         alias="status",
         description="Filter by status (clean, planned, worn, dirty)",
     ),
-    skip: int = Query(0, ge=0, description="Number of items to skip (for pagination)"),
+    skip: int = Query(
+        0, ge=0, description="Number of items to skip (for pagination; ignored when cursor is set)"
+    ),
     limit: int = Query(
         100, ge=1, le=1000, description="Maximum number of items to return"
     ),
+    cursor: Optional[int] = Query(
+        None,
+        ge=1,
+        description="Return items older than this item ID (value of X-Next-Cursor from the previous page)",
+    ),
     current_user: WorkOSUserResponse = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> list[WardrobeResponse]:
+) -> Response:
     """
-    Get wardrobe items for the authenticated user.
+    Get wardrobe items for the authenticated user, newest first.
 
     **Filtering:**
     - Filter by category (e.g., "shirt", "pants")
     - Filter by status (clean, planned, worn, dirty)
-    - Pagination with skip/limit
+    - Cursor pagination with cursor/limit (preferred - constant cost per page)
+    - Offset pagination with skip/limit
+
+    When a full page is returned, the X-Next-Cursor response header holds the
+    cursor for the next page.
 
     **Authorization:**
     - Users can only access their own wardrobe items
 
     Args:
+        request: Current request (for If-None-Match)
         category: Optional category filter
         status_filter: Optional status filter
-        skip: Number of items to skip
+        skip: Number of items to skip (ignored when cursor is set)
         limit: Maximum number of items to return
+        cursor: Optional keyset cursor (last item ID of the previous page)
         current_user: Authenticated user (from JWT token)
         db: Database session
 
     Returns:
-        List of wardrobe items
+        List of wardrobe items, serialized with orjson (response_model is
+        used for the OpenAPI schema only; up to 1000 rows skip per-item
+        pydantic validation). Served from Redis for up to
+        WARDROBE_LIST_CACHE_TTL seconds; wardrobe writes invalidate it.
+        Carries an ETag; a matching If-None-Match gets an empty 304.
     """
-    wardrobe_service = WardrobeService()
-    try:
-        import time
-
-        db_query_start = time.time()
+    wardrobe_service = get_wardrobe_service()
+    if cursor is not None:
+        # Keyset pages never use OFFSET
+        skip = 0
+
+    async def load_items() -> Tuple[list[Dict[str, Any]], Optional[str]]:
+        # One record per load carrying both the row count and the query time;
+        # skip the timing entirely when the record won't be emitted
+        timed = logger.isEnabledFor(logging.INFO)
+        if timed:
+            db_query_start = time.perf_counter()
         items = await wardrobe_service.get_wardrobe_items(
             db,
             current_user.id,
@@ -87,20 +152,37 @@ async def get_wardrobe_items(
             status=status_filter,
             skip=skip,
             limit=limit,
+            before_id=cursor,
         )
-        db_query_time = (time.time() - db_query_start) * 1000
-        logger.debug(
-            f"Database query (get_wardrobe_items) took {db_query_time:.1f}ms",
-            extra={"timing_ms": db_query_time, "operation": "get_wardrobe_items"},
-        )
-        logger.info(
-            f"Retrieved {len(items)} wardrobe items for user: {current_user.id}"
+        if timed:
+            db_query_time = (time.perf_counter() - db_query_start) * 1000
+            logger.info(
+                "Retrieved %s wardrobe items for user: %s (query took %.1fms)",
+                len(items), current_user.id, db_query_time,
+                extra={"timing_ms": db_query_time, "operation": "get_wardrobe_items"},
+            )
+        # A full page may have more behind it; a short one is the last
+        next_cursor = str(items[-1].id) if len(items) == limit else None
+        return [_item_to_dict(item) for item in items], next_cursor
+
+    try:
+        # Cache-aside keyed on the full query signature; writes drop the user's whole hash
+        status_value = status_filter.value if status_filter else None
+        payload, next_cursor = await cached_json_page(
+            wardrobe_list_cache_key(current_user.id),
+            f"{category}|{status_value}|{skip}|{limit}|{cursor}",
+            WARDROBE_LIST_CACHE_TTL,
+            load_items,
         )
-        return items
+        response = conditional_json_response(request, payload)
+        if next_cursor is not None:
+            response.headers["X-Next-Cursor"] = next_cursor
+        return response
     except Exception as e:
         logger.error(
-            f"Unexpected error getting wardrobe items for user {current_user.id}: {type(e).__name__}: {e}",
-            exc_info=True,
+            "Unexpected error getting wardrobe items for user %s: %s: %s",
+            current_user.id, type(e).__name__, e,
+            exc_info=not isinstance(e, TRANSIENT_DB_ERRORS),
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -111,21 +193,24 @@ async def get_wardrobe_items(
 @router.get(
     "/{item_id}",
     response_model=WardrobeResponse,
+    response_class=ORJSONResponse,
     summary="Get wardrobe item",
     description="Get a specific wardrobe item by ID for the authenticated user.",
     status_code=status.HTTP_200_OK,
     responses={
         200: {"description": "Wardrobe item retrieved successfully"},
+        304: {"description": "Item unchanged since the ETag sent in If-None-Match"},
         401: {"description": "Unauthorized - authentication required"},
         404: {"description": "Wardrobe item not found"},
         500: {"description": "Internal server error"},
     },
 )
 async def get_wardrobe_item(
+    request: Request,
     item_id: int,
     current_user: WorkOSUserResponse = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> WardrobeResponse:
+) -> Response:
     """
     Get a specific wardrobe item by ID.
 
@@ -133,31 +218,42 @@ async def get_wardrobe_item(
     - Users can only access their own wardrobe items
 
     Args:
+        request: Current request (for If-None-Match)
         item_id: Item ID
         current_user: Authenticated user (from JWT token)
         db: Database session
 
     Returns:
-        Wardrobe item
+        Wardrobe item JSON with an ETag, or 304 Not Modified. Responses are
+        cached in-process for ITEM_RESPONSE_CACHE_TTL seconds, so repeat
+        lookups skip the database and serialization.
 
     Raises:
         HTTPException: 404 if item not found or doesn't belong to user
     """
-    wardrobe_service = WardrobeService()
+    cache_key = (current_user.id, item_id)
+    cached_item = _item_response_cache.get(cache_key)
+    if cached_item is not None:
+        return conditional_json_response(request, cached_item)
+
+    wardrobe_service = get_wardrobe_service()
     try:
         item = await wardrobe_service.get_wardrobe_item(db, item_id, current_user.id)
         if not item:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Wardrobe item not found"
             )
-        logger.info(f"Retrieved wardrobe item {item_id} for user: {current_user.id}")
-        return item
+        logger.info("Retrieved wardrobe item %s for user: %s", item_id, current_user.id)
+        payload = dump_json(_item_to_dict(item))
+        _item_response_cache[cache_key] = payload
+        return conditional_json_response(request, payload)
     except HTTPException:
         raise
     except Exception as e:
         logger.error(
-            f"Unexpected error getting wardrobe item {item_id} for user {current_user.id}: {type(e).__name__}: {e}",
-            exc_info=True,
+            "Unexpected error getting wardrobe item %s for user %s: %s: %s",
+            item_id, current_user.id, type(e).__name__, e,
+            exc_info=not isinstance(e, TRANSIENT_DB_ERRORS),
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -168,6 +264,7 @@ async def get_wardrobe_item(
 @router.post(
     "",
     response_model=WardrobeResponse,
+    response_class=ORJSONResponse,
     summary="Create wardrobe item",
     description="Create a new wardrobe item for the authenticated user.",
     status_code=status.HTTP_201_CREATED,
@@ -182,7 +279,7 @@ async def create_wardrobe_item(
     wardrobe_data: WardrobeCreate,
     current_user: WorkOSUserResponse = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> WardrobeResponse:
+) -> ORJSONResponse:
     """
     Create a new wardrobe item.
 
@@ -199,27 +296,34 @@ async def create_wardrobe_item(
         db: Database session
 
     Returns:
-        Created wardrobe item
+        Created wardrobe item, serialized with orjson (response_model is kept
+        for the OpenAPI schema only)
 
     Raises:
         HTTPException: 400 for validation errors, 500 for unexpected errors
     """
-    wardrobe_service = WardrobeService()
+    wardrobe_service = get_wardrobe_service()
     try:
         item = await wardrobe_service.create_wardrobe_item(
             db, current_user.id, wardrobe_data
         )
-        logger.info(f"Created wardrobe item '{item.title}' for user: {current_user.id}")
-        return item
+        # Commit before invalidating: get_db only commits after the response is sent,
+        # so a follow-up GET could otherwise re-cache the pre-write rows
+        await db.commit()
+        await invalidate_cache(wardrobe_list_cache_key(current_user.id))
+        return ORJSONResponse(
+            content=_item_to_dict(item), status_code=status.HTTP_201_CREATED
+        )
     except ValueError as e:
-        logger.warning(f"Wardrobe item creation failed: {e}")
+        logger.warning("Wardrobe item creation failed: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
         ) from e
     except Exception as e:
         logger.error(
-            f"Unexpected error creating wardrobe item for user {current_user.id}: {type(e).__name__}: {e}",
-            exc_info=True,
+            "Unexpected error creating wardrobe item for user %s: %s: %s",
+            current_user.id, type(e).__name__, e,
+            exc_info=not isinstance(e, TRANSIENT_DB_ERRORS),
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -230,6 +334,7 @@ async def create_wardrobe_item(
 @router.patch(
     "/{item_id}",
     response_model=WardrobeResponse,
+    response_class=ORJSONResponse,
     summary="Update wardrobe item",
     description="Update a wardrobe item. All fields are optional for partial updates.",
     status_code=status.HTTP_200_OK,
@@ -246,7 +351,7 @@ async def update_wardrobe_item(
     wardrobe_data: WardrobeUpdate,
     current_user: WorkOSUserResponse = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> WardrobeResponse:
+) -> ORJSONResponse:
     """
     Update a wardrobe item.
 
@@ -264,12 +369,12 @@ async def update_wardrobe_item(
         db: Database session
 
     Returns:
-        Updated wardrobe item
+        Updated wardrobe item, serialized with orjson
 
     Raises:
         HTTPException: 404 if item not found, 400 for validation errors
     """
-    wardrobe_service = WardrobeService()
+    wardrobe_service = get_wardrobe_service()
     try:
         item = await wardrobe_service.update_wardrobe_item(
             db, item_id, current_user.id, wardrobe_data
@@ -278,19 +383,22 @@ async def update_wardrobe_item(
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Wardrobe item not found"
             )
-        logger.info(f"Updated wardrobe item {item_id} for user: {current_user.id}")
-        return item
+        await db.commit()
+        _item_response_cache.pop((current_user.id, item_id), None)
+        await invalidate_cache(wardrobe_list_cache_key(current_user.id))
+        return ORJSONResponse(content=_item_to_dict(item))
     except HTTPException:
         raise
     except ValueError as e:
-        logger.warning(f"Wardrobe item update failed: {e}")
+        logger.warning("Wardrobe item update failed: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
         ) from e
     except Exception as e:
         logger.error(
-            f"Unexpected error updating wardrobe item {item_id} for user {current_user.id}: {type(e).__name__}: {e}",
-            exc_info=True,
+            "Unexpected error updating wardrobe item %s for user %s: %s: %s",
+            item_id, current_user.id, type(e).__name__, e,
+            exc_info=not isinstance(e, TRANSIENT_DB_ERRORS),
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -314,7 +422,7 @@ async def delete_wardrobe_item(
     item_id: int,
     current_user: WorkOSUserResponse = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> None:
+) -> Response:
     """
     Delete a wardrobe item.
 
@@ -327,12 +435,12 @@ async def delete_wardrobe_item(
         db: Database session
 
     Returns:
-        None (204 No Content)
+        Empty 204 No Content response (returned directly, skipping response encoding)
 
     Raises:
         HTTPException: 404 if item not found
     """
-    wardrobe_service = WardrobeService()
+    wardrobe_service = get_wardrobe_service()
     try:
         deleted = await wardrobe_service.delete_wardrobe_item(
             db, item_id, current_user.id
@@ -341,14 +449,17 @@ async def delete_wardrobe_item(
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Wardrobe item not found"
             )
-        logger.info(f"Deleted wardrobe item {item_id} for user: {current_user.id}")
-        return None
+        await db.commit()
+        _item_response_cache.pop((current_user.id, item_id), None)
+        await invalidate_cache(wardrobe_list_cache_key(current_user.id))
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
     except HTTPException:
         raise
     except Exception as e:
         logger.error(
-            f"Unexpected error deleting wardrobe item {item_id} for user {current_user.id}: {type(e).__name__}: {e}",
-            exc_info=True,
+            "Unexpected error deleting wardrobe item %s for user %s: %s: %s",
+            item_id, current_user.id, type(e).__name__, e,
+            exc_info=not isinstance(e, TRANSIENT_DB_ERRORS),
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -359,6 +470,7 @@ async def delete_wardrobe_item(
 @router.post(
     "/{item_id}/mark-worn",
     response_model=WardrobeResponse,
+    response_class=ORJSONResponse,
     summary="Mark item as worn",
     description="Mark a wardrobe item as worn (increments wear_count and updates last_worn_at).",
     status_code=status.HTTP_200_OK,
@@ -373,7 +485,7 @@ async def mark_item_worn(
     item_id: int,
     current_user: WorkOSUserResponse = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> WardrobeResponse:
+) -> ORJSONResponse:
     """
     Mark a wardrobe item as worn.
 
@@ -391,28 +503,29 @@ async def mark_item_worn(
         db: Database session
 
     Returns:
-        Updated wardrobe item
+        Updated wardrobe item, serialized with orjson
 
     Raises:
         HTTPException: 404 if item not found
     """
-    wardrobe_service = WardrobeService()
+    wardrobe_service = get_wardrobe_service()
     try:
         item = await wardrobe_service.mark_item_worn(db, item_id, current_user.id)
         if not item:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Wardrobe item not found"
             )
-        logger.info(
-            f"Marked wardrobe item {item_id} as worn for user: {current_user.id}"
-        )
-        return item
+        await db.commit()
+        _item_response_cache.pop((current_user.id, item_id), None)
+        await invalidate_cache(wardrobe_list_cache_key(current_user.id))
+        return ORJSONResponse(content=_item_to_dict(item))
     except HTTPException:
         raise
     except Exception as e:
         logger.error(
-            f"Unexpected error marking item {item_id} as worn for user {current_user.id}: {type(e).__name__}: {e}",
-            exc_info=True,
+            "Unexpected error marking item %s as worn for user %s: %s: %s",
+            item_id, current_user.id, type(e).__name__, e,
+            exc_info=not isinstance(e, TRANSIENT_DB_ERRORS),
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,8 +1,6 @@
-from typing import Optional
 from pydantic import BaseModel, Field, field_validator, model_validator
-from datetime import datetime
 
-from app.api.v1.schemas.user import AuthUserResponse, WorkOSUserResponse
+from app.api.v1.schemas.user import AuthUserResponse, WorkOSUserResponse, validate_password_strength
 
 class EmailVerificationRequiredResponse(BaseModel):
     message: str
@@ -35,23 +33,13 @@ class SignupRequest(BaseModel):
     email: str = Field(..., min_length=1, max_length=255, description="User email")
     password: str = Field(..., min_length=8, max_length=255, description="User password")
     confirm_password: str = Field(..., min_length=8, max_length=255, description="Password confirmation")
-    first_name: Optional[str] = Field(None, max_length=255, description="User first name")
-    last_name: Optional[str] = Field(None, max_length=255, description="User last name")
+    first_name: str | None = Field(None, max_length=255, description="User first name")
+    last_name: str | None = Field(None, max_length=255, description="User last name")
     
     @field_validator('password')
     def validate_password(cls, v: str) -> str:
         """Validate password strength."""
-        if len(v) < 8:
-            raise ValueError("Password must be at least 8 characters long")
-        if not any(char.isdigit() for char in v):
-            raise ValueError("Password must contain at least one number")
-        if not any(char.isalpha() for char in v):
-            raise ValueError("Password must contain at least one letter")
-        if not any(char.isupper() for char in v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not any(char.islower() for char in v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        return v
+        return validate_password_strength(v)
     
     @model_validator(mode='after')
     def validate_confirm_password(self) -> 'SignupRequest':
@@ -102,17 +90,7 @@ class ResetPasswordRequest(WorkOSResetPasswordRequest):
     @field_validator('new_password')
     def validate_new_password(cls, v: str) -> str:
         """Validate new password strength."""
-        if len(v) < 8:
-            raise ValueError("Password must be at least 8 characters long")
-        if not any(char.isdigit() for char in v):
-            raise ValueError("Password must contain at least one number")
-        if not any(char.isalpha() for char in v):
-            raise ValueError("Password must contain at least one letter")
-        if not any(char.isupper() for char in v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not any(char.islower() for char in v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        return v
+        return validate_password_strength(v)
     
     @model_validator(mode='after')
     def validate_confirm_new_password(self) -> 'ResetPasswordRequest':
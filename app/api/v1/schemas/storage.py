@@ -1,8 +1,12 @@
 """
 Storage schemas for image upload responses
 """
+
 from pydantic import BaseModel, Field
 
+# Upper bound on URLs signed per batch request (keeps a single handler call bounded)
+MAX_PRESIGNED_BATCH_SIZE = 100
+
 
 class ImageUploadResponse(BaseModel):
     """
@@ -38,3 +42,41 @@ class PresignedUploadResponse(BaseModel):
         }
     }}
 
+
+
+class PresignedItemRequest(BaseModel):
+    """
+    A single upload slot in a batch presigned URL request
+    """
+    folder: str = Field(default="images", description="S3 folder/path prefix (e.g., 'images', 'profile', 'wardrobe')")
+    file_extension: str = Field(default="jpg", description="File extension (e.g., 'jpg', 'png')")
+
+
+class PresignedBatchRequest(BaseModel):
+    """
+    Request schema for the batch presigned URL endpoint
+    
+    All URLs in the batch share the same expiration.
+    """
+    items: list[PresignedItemRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_PRESIGNED_BATCH_SIZE,
+        description=f"Upload slots to sign (1-{MAX_PRESIGNED_BATCH_SIZE})"
+    )
+    expiration: int = Field(
+        default=3600,
+        ge=60,
+        le=3600,
+        description="URL expiration time in seconds (60-3600, default: 3600 = 1 hour)"
+    )
+    
+    model_config = {"json_schema_extra": {
+        "example": {
+            "items": [
+                {"folder": "wardrobe", "file_extension": "jpg"},
+                {"folder": "wardrobe", "file_extension": "png"}
+            ],
+            "expiration": 3600
+        }
+    }}
@@ -4,8 +4,7 @@ Request and response models for Task API endpoints
 Reference: https://fastapi.tiangolo.com/tutorial/body/
 """
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TaskBase(BaseModel):
@@ -14,7 +13,7 @@ class TaskBase(BaseModel):
     Used as base for create and update schemas
     """
     title: str = Field(..., min_length=1, max_length=200, description="Task title")
-    description: Optional[str] = Field(None, max_length=1000, description="Task description")
+    description: str | None = Field(None, max_length=1000, description="Task description")
     completed: bool = Field(default=False, description="Whether the task is completed")
 
 
@@ -32,9 +31,9 @@ class TaskUpdate(BaseModel):
     All fields are optional for partial updates
     Reference: https://fastapi.tiangolo.com/tutorial/body-updates/
     """
-    title: Optional[str] = Field(None, min_length=1, max_length=200, description="Task title")
-    description: Optional[str] = Field(None, max_length=1000, description="Task description")
-    completed: Optional[bool] = Field(None, description="Whether the task is completed")
+    title: str | None = Field(None, min_length=1, max_length=200, description="Task title")
+    description: str | None = Field(None, max_length=1000, description="Task description")
+    completed: bool | None = Field(None, description="Whether the task is completed")
 
 
 class TaskResponse(TaskBase):
@@ -46,16 +45,12 @@ class TaskResponse(TaskBase):
     # Timestamps are optional because they may not be immediately available
     # after flush() in serverless environments (database sets them, but asyncpg
     # may not return them without refresh which can cause connection issues)
-    created_at: Optional[datetime] = Field(None, description="Timestamp when task was created")
-    updated_at: Optional[datetime] = Field(None, description="Timestamp when task was last updated")
+    created_at: datetime | None = Field(None, description="Timestamp when task was created")
+    updated_at: datetime | None = Field(None, description="Timestamp when task was last updated")
     
-    class Config:
-        """
-        Pydantic configuration
-        Reference: https://docs.pydantic.dev/latest/concepts/config/
-        """
-        from_attributes = True  # Allow creation from ORM objects (SQLAlchemy models)
-        json_encoders = {
-            datetime: lambda v: v.isoformat()  # Convert datetime to ISO format in JSON
-        }
+    # Pydantic configuration
+    # Datetimes are serialized to ISO 8601 natively by pydantic-core; a json_encoders
+    # lambda would route every timestamp back through Python on each response
+    # Reference: https://docs.pydantic.dev/latest/concepts/config/
+    model_config = ConfigDict(from_attributes=True)  # Allow creation from ORM objects (SQLAlchemy models)
 
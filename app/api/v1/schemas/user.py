@@ -1,18 +1,45 @@
 from datetime import datetime
-from typing import Optional
-from uuid import UUID
 import re
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_serializer, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from app.models.user import SizeStandard, Gender
 
 
+def validate_password_strength(password: str) -> str:
+    """
+    Check password strength rules, raising ValueError with the first rule broken.
+
+    Shared by every schema that accepts a new password (UserCreate, SignupRequest,
+    ResetPasswordRequest).
+
+    Scans the password once, collecting every character class on the way,
+    instead of one any() pass per rule.
+    """
+    if len(password) < 8:
+        raise ValueError("Password must be at least 8 characters long")
+    has_digit = has_alpha = has_upper = has_lower = False
+    for char in password:
+        has_digit = has_digit or char.isdigit()
+        has_alpha = has_alpha or char.isalpha()
+        has_upper = has_upper or char.isupper()
+        has_lower = has_lower or char.islower()
+    if not has_digit:
+        raise ValueError("Password must contain at least one number")
+    if not has_alpha:
+        raise ValueError("Password must contain at least one letter")
+    if not has_upper:
+        raise ValueError("Password must contain at least one uppercase letter")
+    if not has_lower:
+        raise ValueError("Password must contain at least one lowercase letter")
+    return password
+
+
 class UserBase(BaseModel):
     """
     Base schema with common User fields
     Used as base for create schemas
     """
-    first_name: Optional[str] = Field(None, max_length=255, description="User first name")
-    last_name: Optional[str] = Field(None, max_length=255, description="User last name")
+    first_name: str | None = Field(None, max_length=255, description="User first name")
+    last_name: str | None = Field(None, max_length=255, description="User last name")
     email: str = Field(..., min_length=1, max_length=255, description="User email")
     password: str = Field(..., min_length=8, max_length=255, description="User password")
 
@@ -32,17 +59,7 @@ class UserCreate(UserBase):
     
     @field_validator('password')
     def validate_password(cls, v: str) -> str:
-        if len(v) < 8:
-            raise ValueError("Password must be at least 8 characters long")
-        if not any(char.isdigit() for char in v):
-            raise ValueError("Password must contain at least one number")
-        if not any(char.isalpha() for char in v):
-            raise ValueError("Password must contain at least one letter")
-        if not any(char.isupper() for char in v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not any(char.islower() for char in v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        return v
+        return validate_password_strength(v)
 
     @model_validator(mode='after')
     def validate_confirm_password(self) -> 'UserCreate':
@@ -67,12 +84,12 @@ class UserResponse(BaseModel):
     Reference: https://fastapi.tiangolo.com/tutorial/response-model/
     """
     id: str = Field(..., description="User ID")
-    first_name: Optional[str] = Field(None, max_length=255, description="User first name")
-    last_name: Optional[str] = Field(None, max_length=255, description="User last name")
+    first_name: str | None = Field(None, max_length=255, description="User first name")
+    last_name: str | None = Field(None, max_length=255, description="User last name")
     email: str = Field(..., min_length=1, max_length=255, description="User email")
     is_onboarded: bool = Field(False, description="Boolean indicating if user has completed onboarding")
-    created_at: Optional[datetime] = Field(None, description="Timestamp when user was created")
-    updated_at: Optional[datetime] = Field(None, description="Timestamp when user was last updated")
+    created_at: datetime | None = Field(None, description="Timestamp when user was created")
+    updated_at: datetime | None = Field(None, description="Timestamp when user was last updated")
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -81,9 +98,9 @@ class UserUpdate(BaseModel):
     Schema for updating a user
     All fields are optional for partial updates
     """
-    first_name: Optional[str] = Field(None, max_length=255, description="User first name")
-    last_name: Optional[str] = Field(None, max_length=255, description="User last name")
-    is_onboarded: Optional[bool] = Field(None, description="Boolean indicating if user has completed onboarding")
+    first_name: str | None = Field(None, max_length=255, description="User first name")
+    last_name: str | None = Field(None, max_length=255, description="User last name")
+    is_onboarded: bool | None = Field(None, description="Boolean indicating if user has completed onboarding")
 
 
 class WorkOSUserResponse(BaseModel):
@@ -97,8 +114,7 @@ class WorkOSUserResponse(BaseModel):
     created_at: datetime = Field(..., description="User created at")
     updated_at: datetime = Field(..., description="User updated at")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AuthUserResponse(WorkOSUserResponse):
@@ -131,23 +147,23 @@ class UserProfileCreate(BaseModel):
     
     Reference: https://docs.pydantic.dev/latest/concepts/validators/
     """
-    gender: Optional[Gender] = Field(
+    gender: Gender | None = Field(
         None,
         description="User's gender identity"
     )
-    height_cm: Optional[float] = Field(
+    height_cm: float | None = Field(
         None, 
         ge=0, 
         le=300,  # Reasonable max height in cm (~10 feet)
         description="User height in centimeters"
     )
-    waist_cm: Optional[float] = Field(
+    waist_cm: float | None = Field(
         None, 
         ge=0, 
         le=200,  # Reasonable max waist in cm
         description="User waist in centimeters"
     )
-    measurements: Optional[dict[str, float]] = Field(
+    measurements: dict[str, float] | None = Field(
         None, 
         description="User gender-specific body measurements in JSON format. Keys should include units (e.g., 'bust_cm', 'chest_cm', 'hips_cm', 'shoulder_width_cm'). Example: {'bust_cm': 90.0, 'hips_cm': 95.0} for female or {'chest_cm': 100.0, 'shoulder_width_cm': 45.0} for male",
         json_schema_extra={
@@ -157,24 +173,24 @@ class UserProfileCreate(BaseModel):
             }
         }
     )
-    shoe_size_value: Optional[str] = Field(None, max_length=20, description="Shoe size value (e.g., '7', '7.5', '40')")
-    shoe_size_standard: Optional[SizeStandard] = Field(None, description="Standard for shoe size (defaults to US if omitted)")
-    shirt_size_value: Optional[str] = Field(None, max_length=20, description="Shirt size value (e.g., 'M', 'XL', '10')")
-    shirt_size_standard: Optional[SizeStandard] = Field(None, description="Standard for shirt size (defaults to US if omitted)")
-    jacket_size_value: Optional[str] = Field(None, max_length=20, description="Jacket size value (e.g., 'M', 'XL', '10')")
-    jacket_size_standard: Optional[SizeStandard] = Field(None, description="Standard for jacket size (defaults to US if omitted)")
-    pants_size_value: Optional[str] = Field(None, max_length=20, description="Pants size value (e.g., '32', '32x34' for waist x inseam)")
-    pants_size_standard: Optional[SizeStandard] = Field(None, description="Standard for pants size (defaults to US if omitted)")
-    top_size_value: Optional[str] = Field(None, max_length=20, description="Top size value (e.g., 'M', 'XL', '10')")
-    top_size_standard: Optional[SizeStandard] = Field(None, description="Standard for top size (defaults to US if omitted)")
-    dress_size_value: Optional[str] = Field(None, max_length=20, description="Dress size value (e.g., 'M', 'XL', '10')")
-    dress_size_standard: Optional[SizeStandard] = Field(None, description="Standard for dress size (defaults to US if omitted)")
-    profile_picture_url: Optional[str] = Field(
+    shoe_size_value: str | None = Field(None, max_length=20, description="Shoe size value (e.g., '7', '7.5', '40')")
+    shoe_size_standard: SizeStandard | None = Field(None, description="Standard for shoe size (defaults to US if omitted)")
+    shirt_size_value: str | None = Field(None, max_length=20, description="Shirt size value (e.g., 'M', 'XL', '10')")
+    shirt_size_standard: SizeStandard | None = Field(None, description="Standard for shirt size (defaults to US if omitted)")
+    jacket_size_value: str | None = Field(None, max_length=20, description="Jacket size value (e.g., 'M', 'XL', '10')")
+    jacket_size_standard: SizeStandard | None = Field(None, description="Standard for jacket size (defaults to US if omitted)")
+    pants_size_value: str | None = Field(None, max_length=20, description="Pants size value (e.g., '32', '32x34' for waist x inseam)")
+    pants_size_standard: SizeStandard | None = Field(None, description="Standard for pants size (defaults to US if omitted)")
+    top_size_value: str | None = Field(None, max_length=20, description="Top size value (e.g., 'M', 'XL', '10')")
+    top_size_standard: SizeStandard | None = Field(None, description="Standard for top size (defaults to US if omitted)")
+    dress_size_value: str | None = Field(None, max_length=20, description="Dress size value (e.g., 'M', 'XL', '10')")
+    dress_size_standard: SizeStandard | None = Field(None, description="Standard for dress size (defaults to US if omitted)")
+    profile_picture_url: str | None = Field(
         None, 
         max_length=500,
         description="User profile picture URL"
     )
-    full_body_image_url: Optional[str] = Field(
+    full_body_image_url: str | None = Field(
         None, 
         max_length=500,
         description="User full body image URL"
@@ -182,7 +198,7 @@ class UserProfileCreate(BaseModel):
 
     @field_validator('measurements')
     @classmethod
-    def validate_measurements(cls, v: Optional[dict[str, float]]) -> Optional[dict[str, float]]:
+    def validate_measurements(cls, v: dict[str, float] | None) -> dict[str, float] | None:
         """Validate measurements JSON structure and values"""
         if v is None:
             return v
@@ -201,7 +217,7 @@ class UserProfileCreate(BaseModel):
 
     @field_validator('shoe_size_value')
     @classmethod
-    def validate_shoe_size(cls, v: Optional[str]) -> Optional[str]:
+    def validate_shoe_size(cls, v: str | None) -> str | None:
         """Validate shoe size: numeric only (e.g., '7', '7.5', '40')."""
         if v is None:
             return v
@@ -216,7 +232,7 @@ class UserProfileCreate(BaseModel):
 
     @field_validator('shirt_size_value', 'jacket_size_value', 'top_size_value', 'dress_size_value')
     @classmethod
-    def validate_clothing_size(cls, v: Optional[str]) -> Optional[str]:
+    def validate_clothing_size(cls, v: str | None) -> str | None:
         """Validate clothing size format: letter sizes (XS-XXXL) or numeric."""
         if v is None:
             return v
@@ -236,7 +252,7 @@ class UserProfileCreate(BaseModel):
 
     @field_validator('pants_size_value')
     @classmethod
-    def validate_pants_size(cls, v: Optional[str]) -> Optional[str]:
+    def validate_pants_size(cls, v: str | None) -> str | None:
         """Validate pants size: numeric waist or combined waist x inseam."""
         if v is None:
             return v
@@ -293,5 +309,14 @@ class UserProfileResponse(UserProfileCreate):
     user_id: str = Field(..., description="User ID")
     created_at: datetime = Field(..., description="User profile created at")
     updated_at: datetime = Field(..., description="User profile updated at")
-    class Config:
-        from_attributes = True
\ No newline at end of file
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class UserMeResponse(BaseModel):
+    """
+    Schema for the authenticated user together with their profile
+    Lets clients load both with one request instead of GET /user/{user_id} + GET /user/profile
+    """
+    user: UserResponse = Field(..., description="Authenticated user")
+    profile: UserProfileResponse | None = Field(None, description="User profile, or null if not created yet")
@@ -3,7 +3,6 @@ Schemas for virtual try-on sessions.
 """
 
 from datetime import datetime
-from typing import List, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
@@ -16,21 +15,21 @@ class SelectedItem(BaseModel):
     Examples: 6 (wardrobe item from DB), "external-123" (temporary item not yet saved).
     """
 
-    id: Union[int, str] = Field(
+    id: int | str = Field(
         ...,
         union_mode="left_to_right",  # Try int first, then str for explicit coercion
         description="Original wardrobe item identifier (int for DB items, str for external/temporary items)",
     )
     title: str = Field(..., description="Item title at selection time")
     category: str = Field(..., description="Item category (e.g., shirt)")
-    colors: List[str] = Field(..., description="Colors associated with the item")
-    tags: List[str] = Field(
+    colors: list[str] = Field(..., description="Colors associated with the item")
+    tags: list[str] = Field(
         ..., description="Tags associated with the item (e.g., casual, streetwear)"
     )
 
     @field_validator("colors", "tags")
     @classmethod
-    def ensure_non_empty(cls, items: List[str]) -> List[str]:
+    def ensure_non_empty(cls, items: list[str]) -> list[str]:
         """Ensure list fields are not empty."""
 
         if not items:
@@ -55,12 +54,12 @@ class VirtualTryOnBase(BaseModel):
         default=True,
         description="Toggle to determine clean background usage (`useCleanBackground`)",
     )
-    custom_instructions: Optional[str] = Field(
+    custom_instructions: str | None = Field(
         None,
         max_length=500,
         description="Optional prompt override (`customPrompt`). Null/empty if user left it blank",
     )
-    selected_items: List[SelectedItem] = Field(
+    selected_items: list[SelectedItem] = Field(
         ...,
         min_length=1,
         description="Snapshot of wardrobe items included in this try-on",
@@ -72,7 +71,7 @@ class VirtualTryOnCreate(VirtualTryOnBase):
 
     @field_validator("custom_instructions")
     @classmethod
-    def normalize_instructions(cls, value: Optional[str]) -> Optional[str]:
+    def normalize_instructions(cls, value: str | None) -> str | None:
         """Trim whitespace and convert empty strings to None."""
 
         if value is None:
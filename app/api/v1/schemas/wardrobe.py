@@ -4,9 +4,8 @@ Reference: https://fastapi.tiangolo.com/tutorial/body/
 """
 
 from datetime import datetime
-from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.wardrobe import ItemStatus
 
@@ -23,15 +22,15 @@ class WardrobeBase(BaseModel):
     )
     colors: list[str] = Field(
         ...,
-        min_items=1,
+        min_length=1,
         description="List of colors (e.g., ['burgundy', 'olive green', 'black'])",
     )
     image_url: str = Field(..., max_length=500, description="URL to item image")
-    tags: Optional[list[str]] = Field(
+    tags: list[str] | None = Field(
         None,
         description="List of tags for filtering/searching (e.g., ['short sleeve', 'geometric', 'casual', 'summer', 'silk'])",
     )
-    status: Optional[ItemStatus] = Field(
+    status: ItemStatus | None = Field(
         None, description="Current item status (clean, planned, worn, dirty)"
     )
 
@@ -51,14 +50,6 @@ class WardrobeCreate(WardrobeBase):
         status: Optional item status (defaults to CLEAN if not provided)
     """
 
-    @field_validator("colors")
-    @classmethod
-    def validate_colors(cls, v: list[str]) -> list[str]:
-        """Validate that colors list is not empty"""
-        if not v:
-            raise ValueError("At least one color must be provided")
-        return v
-
 
 class WardrobeUpdate(BaseModel):
     """
@@ -75,37 +66,29 @@ class WardrobeUpdate(BaseModel):
         status: Current item status
     """
 
-    title: Optional[str] = Field(
+    title: str | None = Field(
         None, min_length=1, max_length=200, description="Item title/name"
     )
-    category: Optional[str] = Field(
+    category: str | None = Field(
         None, min_length=1, max_length=50, description="Item category"
     )
-    colors: Optional[list[str]] = Field(None, min_items=1, description="List of colors")
-    image_url: Optional[str] = Field(
+    colors: list[str] | None = Field(None, min_length=1, description="List of colors")
+    image_url: str | None = Field(
         None, max_length=500, description="URL to item image"
     )
-    tags: Optional[list[str]] = Field(
+    tags: list[str] | None = Field(
         None, description="List of tags for filtering/searching"
     )
-    status: Optional[ItemStatus] = Field(
+    status: ItemStatus | None = Field(
         None, description="Current item status (clean, planned, worn, dirty)"
     )
-    last_worn_at: Optional[datetime] = Field(
+    last_worn_at: datetime | None = Field(
         None, description="Timestamp when item was last worn"
     )
-    wear_count: Optional[int] = Field(
+    wear_count: int | None = Field(
         None, ge=0, description="Number of times item has been worn"
     )
 
-    @field_validator("colors")
-    @classmethod
-    def validate_colors(cls, v: Optional[list[str]]) -> Optional[list[str]]:
-        """Validate that colors list is not empty if provided"""
-        if v is not None and not v:
-            raise ValueError("Colors list cannot be empty if provided")
-        return v
-
 
 class WardrobeResponse(WardrobeBase):
     """
@@ -130,7 +113,7 @@ class WardrobeResponse(WardrobeBase):
 
     id: int = Field(..., description="Item ID")
     user_id: str = Field(..., description="User ID who owns this item")
-    last_worn_at: Optional[datetime] = Field(
+    last_worn_at: datetime | None = Field(
         None, description="Timestamp when item was last worn"
     )
     wear_count: int = Field(..., ge=0, description="Number of times item has been worn")
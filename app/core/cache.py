@@ -0,0 +1,155 @@
+"""
+Cache-aside helpers for pre-serialized JSON responses
+Stores orjson-encoded payloads in Upstash Redis so cache hits skip the database
+and serialization entirely.
+Reference: https://redis.io/docs/latest/develop/use/patterns/cache-aside/
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+from app.core.redis import get_redis_client
+from app.core.responses import dump_json
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Loads currently running in this worker, keyed like the cache entry they fill
+_inflight: Dict[str, "asyncio.Future[Any]"] = {}
+
+
+async def cached_json_page(
+    key: str,
+    field: str,
+    ttl: int,
+    loader: Callable[[], Awaitable[Tuple[Any, Optional[str]]]],
+) -> Tuple[bytes, Optional[str]]:
+    """
+    Return one cached page of a list and its next-page cursor, loading and caching them on a miss.
+
+    Entries live as fields of a Redis hash so every variant of a query (filters,
+    pagination) for one owner can be dropped with a single DEL via invalidate_cache.
+    The cursor sits in a sibling field ("{field}|next") read in the same round
+    trip, so a cache hit never has to decode the payload to find it.
+    Without Redis configured this simply calls the loader.
+
+    Args:
+        key: Redis hash key grouping related entries (e.g., "wardrobe:list:{user_id}")
+        field: Entry within the hash, normally the full query signature
+        ttl: Expiration in seconds, applied to the whole hash on every write
+        loader: Coroutine factory returning (plain JSON-serializable data, next cursor or None)
+
+    Returns:
+        (orjson-encoded payload, next cursor or None on the last page)
+    """
+    cursor_field = f"{field}|next"
+    redis_client = get_redis_client()
+    if redis_client:
+        cached, cached_cursor = await redis_client.hmget(key, [field, cursor_field])
+        if cached is not None and cached_cursor is not None:
+            logger.debug("Cache hit for %s[%s]", key, field)
+            return cached.encode(), cached_cursor or None
+
+    data, next_cursor = await loader()
+    payload = dump_json(data)
+
+    if redis_client:
+        await redis_client.hset_with_expiry(
+            key, {field: payload.decode(), cursor_field: next_cursor or ""}, ttl
+        )
+    return payload, next_cursor
+
+
+async def get_cached_json(key: str) -> Optional[bytes]:
+    """
+    Return the JSON bytes cached under a plain Redis key, or None on a miss.
+
+    Counterpart of set_cached_json for single-value entries (one key per object).
+    """
+    redis_client = get_redis_client()
+    if not redis_client:
+        return None
+    cached = await redis_client.get(key)
+    if cached is None:
+        return None
+    logger.debug("Cache hit for %s", key)
+    return cached.encode()
+
+
+async def set_cached_json(key: str, payload: bytes, ttl: int) -> None:
+    """
+    Cache already-encoded JSON bytes under a plain Redis key for ttl seconds.
+
+    Failures are logged by the Redis client and otherwise ignored - the next
+    read simply misses and goes to the database.
+    """
+    redis_client = get_redis_client()
+    if redis_client:
+        await redis_client.setex(key, ttl, payload.decode())
+
+
+async def invalidate_cache(key: str) -> None:
+    """
+    Drop every cached entry stored under key.
+
+    Call after writes that change what the cached loaders would return.
+    Failures are logged by the Redis client; stale entries still expire via TTL.
+    """
+    redis_client = get_redis_client()
+    if redis_client:
+        await redis_client.delete(key)
+
+
+def _consume_result(future: "asyncio.Future[Any]") -> None:
+    """Mark a shared future's exception as retrieved even if nobody else was waiting."""
+    if not future.cancelled():
+        future.exception()
+
+
+async def singleflight(key: str, loader: Callable[[], Awaitable[T]]) -> T:
+    """
+    Run loader once per key at a time, sharing its result with concurrent callers.
+
+    On a cache miss under a burst (e.g. every screen of an app fetching the same
+    profile right after login), only the first request hits the database; the
+    rest await that request's result instead of issuing identical queries.
+    Errors from the loader are raised in every waiting caller. If the leading
+    request is cancelled (e.g. its client disconnected), one of the waiting
+    callers takes over the load instead of inheriting the cancellation.
+    Coalescing is per worker process.
+
+    Args:
+        key: Identity of the load (normally the cache key it fills)
+        loader: Coroutine factory performing the load
+
+    Returns:
+        The loader's result
+    """
+    while (future := _inflight.get(key)) is not None:
+        logger.debug("Joining in-flight load for %s", key)
+        try:
+            # shield: a follower being cancelled must not cancel the shared load
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # Only the leader was cancelled - retry, joining or becoming the new leader
+            if future.cancelled() and not asyncio.current_task().cancelling():
+                continue
+            raise
+
+    future = asyncio.get_running_loop().create_future()
+    future.add_done_callback(_consume_result)
+    _inflight[key] = future
+    try:
+        result = await loader()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        _inflight.pop(key, None)
@@ -31,6 +31,40 @@ class Settings(BaseSettings):
         ...,
         description="PostgreSQL database URL. Must be set via environment variable."
     )
+    # Connection pool sizing
+    # 0 keeps NullPool (fresh connection per request), required for serverless (Vercel)
+    # Set DB_POOL_SIZE > 0 on long-lived servers so connections are reused across requests
+    # (20 with DB_MAX_OVERFLOW=40 handles a few hundred concurrent requests per worker).
+    # Keep 0 behind PgBouncer - it already multiplexes server connections.
+    # Reference: https://docs.sqlalchemy.org/en/20/core/pooling.html
+    DB_POOL_SIZE: int = Field(
+        default=0,
+        ge=0,
+        description="Persistent connections kept in the pool per process. 0 disables pooling (NullPool)."
+    )
+    DB_MAX_OVERFLOW: int = Field(
+        default=40,
+        ge=0,
+        description="Extra connections allowed above DB_POOL_SIZE under burst load (about 2x the pool size)"
+    )
+    DB_POOL_TIMEOUT: int = Field(
+        default=30,
+        ge=1,
+        description="Seconds to wait for a pooled connection before giving up"
+    )
+    DB_POOL_RECYCLE: int = Field(
+        default=1800,
+        description="Seconds after which pooled connections are replaced (-1 to disable)"
+    )
+    # Prepared statements cached per connection, so repeated queries skip server-side parse/plan.
+    # Set to 0 behind PgBouncer in transaction mode - a statement prepared on one server
+    # connection doesn't exist on the next one.
+    # Reference: https://magicstack.github.io/asyncpg/current/faq.html#why-am-i-getting-prepared-statement-errors
+    DB_STATEMENT_CACHE_SIZE: int = Field(
+        default=500,
+        ge=0,
+        description="Prepared statements cached per database connection. 0 disables the cache."
+    )
 
     # WorkOS Configuration
     # WorkOS API key for user management
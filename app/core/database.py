@@ -6,6 +6,8 @@ Reference: https://docs.sqlalchemy.org/en/20/orm/extensions/asyncio.html
 
 import sys
 import time
+from typing import Optional
+from sqlalchemy.exc import IntegrityError, InterfaceError, OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.pool import NullPool
@@ -20,23 +22,48 @@ if not settings.DATABASE_URL:
         "Please set it in your .env file or Vercel environment variables."
     )
 
-# Create async engine for PostgreSQL
-# Using NullPool for serverless (Vercel) - each request gets a fresh connection
+# Connection pool configuration
+# Default (DB_POOL_SIZE=0): NullPool for serverless (Vercel) - each request gets a fresh connection
 # Connection pooling doesn't work well in serverless environments where functions
 # are isolated and can be terminated/cold-started
+# On long-lived servers (uvicorn/gunicorn workers) set DB_POOL_SIZE > 0 to reuse connections
+# instead of paying a TCP + TLS + auth handshake on every request
+# Behind PgBouncer keep NullPool - pooling on both sides just pins idle server connections
 # Reference: https://docs.sqlalchemy.org/en/20/core/pooling.html#switching-pool-implementations
 # Reference: https://docs.sqlalchemy.org/en/20/orm/extensions/asyncio.html#using-multiple-asyncio-event-loops
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=False,  # Set to True for SQL query logging (useful for debugging)
-    poolclass=NullPool,  # No connection pooling - each request gets a new connection
+if settings.DB_POOL_SIZE > 0:
+    pool_kwargs = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,  # Replace connections before server/proxy idle timeouts
+        "pool_pre_ping": True,  # Detect connections dropped while idle in the pool
+        # Hand out the most recently returned connection first: the busy core of the
+        # pool stays warm while surplus connections sit idle and get recycled
+        # Reference: https://docs.sqlalchemy.org/en/20/core/pooling.html#pool-use-lifo
+        "pool_use_lifo": True,
+    }
+else:
+    # No connection pooling - each request gets a new connection
     # This is critical for serverless environments where connection reuse
     # across function invocations causes connection termination errors
     # Reference: https://docs.sqlalchemy.org/en/20/core/pooling.html#disabling-pooling-using-nullpool
+    pool_kwargs = {"poolclass": NullPool}
+
+# Create async engine for PostgreSQL
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    echo=False,  # Set to True for SQL query logging (useful for debugging)
+    **pool_kwargs,
     connect_args={
         # asyncpg-specific connection arguments
         # Reference: https://magicstack.github.io/asyncpg/current/api/index.html#connection
         "command_timeout": 60,  # Increased timeout for serverless network latency
+        # asyncpg's own statement cache plus SQLAlchemy's prepared statement cache on
+        # top of it (both default to 100); SQLAlchemy's compiled SQL cache is on by default
+        # Reference: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#prepared-statement-cache
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
         "server_settings": {
             "application_name": "fastapi_auth_starter",
         },
@@ -44,6 +71,49 @@ engine = create_async_engine(
 )
 
 
+# Errors raised when the database is unreachable, times out or drops the connection
+# (OSError covers TimeoutError and ConnectionError raised before SQLAlchemy wraps them).
+# These are operational, not bugs - log them without capturing a traceback
+# (exc_info=not isinstance(e, TRANSIENT_DB_ERRORS)): tracebacks are for real bugs,
+# and an outage would otherwise format a full stack for every failing request
+# Reference: https://docs.sqlalchemy.org/en/20/core/exceptions.html
+TRANSIENT_DB_ERRORS = (OperationalError, InterfaceError, OSError)
+
+# PostgreSQL SQLSTATEs for unique_violation / foreign_key_violation
+# Reference: https://www.postgresql.org/docs/current/errcodes-appendix.html
+UNIQUE_VIOLATION = "23505"
+FOREIGN_KEY_VIOLATION = "23503"
+
+
+def is_unique_violation(error: IntegrityError, constraint: Optional[str] = None) -> bool:
+    """
+    Check whether an IntegrityError is a unique constraint violation.
+
+    Reads the SQLSTATE (and constraint name) reported by PostgreSQL instead of
+    searching the error message text.
+
+    Args:
+        error: IntegrityError raised by SQLAlchemy
+        constraint: Optional constraint/index name the violation must come from
+
+    Returns:
+        True if the error is a unique violation (of constraint, when given)
+    """
+    # SQLAlchemy's asyncpg adapter copies the SQLSTATE onto the DBAPI error and
+    # chains the original asyncpg.UniqueViolationError (which has constraint_name)
+    # Reference: https://magicstack.github.io/asyncpg/current/api/index.html#exceptions
+    if getattr(error.orig, "sqlstate", None) != UNIQUE_VIOLATION:
+        return False
+    if constraint is None:
+        return True
+    return getattr(error.orig.__cause__, "constraint_name", None) == constraint
+
+
+def is_foreign_key_violation(error: IntegrityError) -> bool:
+    """Check whether an IntegrityError is a foreign key violation (see is_unique_violation)."""
+    return getattr(error.orig, "sqlstate", None) == FOREIGN_KEY_VIOLATION
+
+
 # Create async session factory
 # This is used to create database sessions throughout the application
 # Reference: https://docs.sqlalchemy.org/en/20/orm/extensions/asyncio.html#session-basics
@@ -106,7 +176,7 @@ async def get_db() -> AsyncSession:
             raise
         finally:
             # Always close the session to release connection
-            # With NullPool, this closes the connection completely
+            # With NullPool, this closes the connection completely (otherwise it returns to the pool)
             # In serverless, this is critical to prevent connection leaks
             try:
                 await session.close()
@@ -4,19 +4,18 @@ Reference: https://fastapi.tiangolo.com/tutorial/dependencies/
 """
 
 import asyncio
+import hashlib
 import logging
 import sys
 import time
 from functools import lru_cache
-from typing import Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from workos import WorkOSClient
 from workos.exceptions import AuthenticationException, NotFoundException
 
 from app.api.v1.schemas.auth import WorkOSUserResponse
-from app.core.config import settings
+from app.core.exceptions import TokenExpiredException
 from app.services.auth import AuthService
 
 logger = logging.getLogger(__name__)
@@ -116,10 +115,26 @@ def _cleanup_expired_blacklist_tokens():
         del _token_blacklist[jti]
     if expired_jtis:
         logger.debug(
-            f"Cleaned up {len(expired_jtis)} expired tokens from in-memory blacklist"
+            "Cleaned up %s expired tokens from in-memory blacklist", len(expired_jtis),
         )
 
 
+# WWW-Authenticate header for expired/revoked tokens (RFC6750), built once
+# Reference: https://datatracker.ietf.org/doc/html/rfc6750#section-3
+_EXPIRED_TOKEN_HEADERS = {
+    "WWW-Authenticate": 'Bearer realm="api", error="invalid_token", error_description="The access token expired"'
+}
+
+# Short-lived cache of verified access tokens, keyed by a hash of the raw token
+# Repeat requests with the same token skip JWT signature verification; expiry and
+# the logout blacklist are still checked on every hit. The TTL bounds how long a
+# token stays trusted without re-verification.
+VERIFIED_TOKEN_CACHE_TTL = 30  # seconds
+VERIFIED_TOKEN_CACHE_MAX_SIZE = 10000
+_verified_token_cache: TTLCache[bytes, dict] = TTLCache(
+    maxsize=VERIFIED_TOKEN_CACHE_MAX_SIZE, ttl=VERIFIED_TOKEN_CACHE_TTL
+)
+
 # HTTPBearer automatically extracts Bearer token from Authorization header
 # Reference: https://fastapi.tiangolo.com/reference/security/#fastapi.security.HTTPBearer
 security = HTTPBearer()
@@ -140,7 +155,41 @@ def get_auth_service() -> AuthService:
     return AuthService()
 
 
+async def _verify_session_cached(auth_service: AuthService, access_token: str) -> dict:
+    """
+    Verify an access token, reusing a recent verification of the same token.
+
+    Args:
+        auth_service: AuthService used on a cache miss
+        access_token: Raw JWT from the Authorization header
+
+    Returns:
+        Session data as returned by AuthService.verify_session
+
+    Raises:
+        TokenExpiredException: If the token has expired or was blacklisted (logout)
+        ValueError: If the token is invalid (cache miss only - invalid tokens are never cached)
+    """
+    # Hash so the cache never holds bearer tokens themselves
+    cache_key = hashlib.blake2b(access_token.encode(), digest_size=16).digest()
+    session_data = _verified_token_cache.get(cache_key)
+    if session_data is None:
+        session_data = await auth_service.verify_session(access_token)
+        _verified_token_cache[cache_key] = session_data
+        return session_data
+
+    # Signature and claims were verified on the miss - only re-check what can
+    # change while the entry is cached
+    exp = session_data.get("exp")
+    jti = session_data.get("jti")
+    if (exp is not None and exp <= time.time()) or (jti and await is_token_blacklisted(jti)):
+        _verified_token_cache.pop(cache_key, None)
+        raise TokenExpiredException()
+    return session_data
+
+
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ) -> WorkOSUserResponse:
     """
@@ -154,7 +203,13 @@ async def get_current_user(
         async def protected_route(current_user = Depends(get_current_user)):
             return {"user_id": current_user.id, "email": current_user.email}
 
+    The resolved user is memoized on request.state, so any later call within the
+    same request (e.g. from another dependency) skips token verification entirely.
+    Across requests, a verified token is trusted for VERIFIED_TOKEN_CACHE_TTL
+    seconds without re-checking its signature.
+
     Args:
+        request: Current request (used for per-request memoization)
         credentials: HTTPAuthorizationCredentials containing the Bearer token
 
     Returns:
@@ -163,18 +218,22 @@ async def get_current_user(
     Raises:
         HTTPException: 401 if token is invalid or missing
     """
+    current_user = getattr(request.state, "current_user", None)
+    if current_user is not None:
+        return current_user
+
     start_time = time.time()
     auth_service = get_auth_service()
 
     try:
         # Extract the token from credentials
         access_token = credentials.credentials
-        logger.debug(f"Verifying session with token: {access_token[:20]}...")
+        logger.debug("Verifying session with token: %s...", access_token[:20])
 
         # Verify the session with WorkOS (validates JWT signature and expiration)
         # Reference: https://workos.com/docs/reference/authkit/session-tokens/access-token
         verify_start = time.time()
-        session_data = await auth_service.verify_session(access_token)
+        session_data = await _verify_session_cached(auth_service, access_token)
         verify_time = (time.time() - verify_start) * 1000
         sys.stdout.write(f"[TIMING] verify_session took {verify_time:.1f}ms\n")
         sys.stdout.flush()
@@ -188,7 +247,7 @@ async def get_current_user(
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        logger.debug(f"Token verified successfully. User ID: {user_id}")
+        logger.debug("Token verified successfully. User ID: %s", user_id)
 
         # OPTIMIZATION: Check cache first to avoid expensive WorkOS API call
         # TTLCache automatically handles expiration and size limits
@@ -199,8 +258,9 @@ async def get_current_user(
                 f"[TIMING] get_current_user (CACHE HIT) took {cache_time:.1f}ms\n"
             )
             sys.stdout.flush()
-            logger.debug(f"User {user_id} found in cache")
-            return _user_cache[user_id]
+            logger.debug("User %s found in cache", user_id)
+            request.state.current_user = _user_cache[user_id]
+            return request.state.current_user
 
         # Cache miss or expired - fetch from WorkOS API
         # This is the expensive call (~1-2 seconds) that we're optimizing
@@ -209,13 +269,12 @@ async def get_current_user(
         )
         sys.stdout.flush()
         get_user_start = time.time()
-        workos_client = WorkOSClient(
-            api_key=settings.WORKOS_API_KEY, client_id=settings.WORKOS_CLIENT_ID
-        )
 
         # Offload synchronous WorkOS call to thread pool
+        # Reuses the singleton AuthService's client (and its HTTP connection pool)
+        # instead of building a new WorkOSClient - and new TLS connection - per miss
         workos_user = await asyncio.to_thread(
-            workos_client.user_management.get_user, user_id=user_id
+            auth_service.workos_client.user_management.get_user, user_id=user_id
         )
         get_user_time = (time.time() - get_user_start) * 1000
         sys.stdout.write(f"[TIMING] get_user API call took {get_user_time:.1f}ms\n")
@@ -242,30 +301,28 @@ async def get_current_user(
         )
         sys.stdout.flush()
         logger.debug(
-            f"User {user_id} cached (max {USER_CACHE_MAX_SIZE} users, TTL {USER_CACHE_TTL}s)"
+            "User %s cached (max %s users, TTL %ss)", user_id, USER_CACHE_MAX_SIZE, USER_CACHE_TTL,
         )
 
+        request.state.current_user = user
         return user
 
+    except TokenExpiredException as e:
+        # RFC6750: use invalid_token for expired tokens
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=e.message,
+            headers=_EXPIRED_TOKEN_HEADERS,
+        ) from e
     except ValueError as e:
         # Map error to RFC6750-compliant WWW-Authenticate header
         msg = str(e)
-        # Default values
-        error = "invalid_token"
         description = msg or "The access token is invalid"
-
-        if "expired" in msg.lower():
-            error = "invalid_token"  # RFC6750: use invalid_token for expired tokens
-            description = "The access token expired"
-            # If message contains "Token verification failed:", remove it for cleaner error
-            if "Token verification failed:" in msg:
-                msg = msg.replace("Token verification failed: ", "")
-
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=msg,
             headers={
-                "WWW-Authenticate": f'Bearer realm="api", error="{error}", error_description="{description}"'
+                "WWW-Authenticate": f'Bearer realm="api", error="invalid_token", error_description="{description}"'
             },
         ) from e
     except NotFoundException:
@@ -289,3 +346,39 @@ async def get_current_user(
             detail=f"Authentication failed: {str(e)}",
             headers={"WWW-Authenticate": "Bearer"},
         ) from e
+
+
+async def require_self_user(
+    user_id: str,
+    current_user: WorkOSUserResponse = Depends(get_current_user),
+) -> WorkOSUserResponse:
+    """
+    Dependency for /{user_id} routes that only the user themselves may access.
+
+    Declare it before Depends(get_db) so a 403 is raised while dependencies are
+    being resolved - before the route body runs or a database session is used.
+
+    Usage:
+        @router.get("/{user_id}")
+        async def get_user(
+            user_id: str,
+            current_user = Depends(require_self_user),
+            db: AsyncSession = Depends(get_db),
+        ): ...
+
+    Args:
+        user_id: Path parameter of the route
+        current_user: Authenticated user (from JWT token)
+
+    Returns:
+        The authenticated user
+
+    Raises:
+        HTTPException: 403 if user_id is not the authenticated user's ID
+    """
+    if user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You can only access your own user account",
+        )
+    return current_user
@@ -4,4 +4,28 @@ class InvalidPasswordException(Exception):
     """
     def __init__(self, message: str = "Old password is incorrect"):
         self.message = message
-        super().__init__(self.message)
\ No newline at end of file
+        super().__init__(self.message)
+
+
+class TokenExpiredException(ValueError):
+    """
+    Exception raised when an access token has expired (or has been revoked)
+
+    Subclasses ValueError so existing `except ValueError` handlers still
+    treat it as an invalid token.
+    """
+    def __init__(self, message: str = "Token has expired"):
+        self.message = message
+        super().__init__(self.message)
+
+
+class AlreadyExistsException(Exception):
+    """
+    Exception raised when creating a resource that already exists
+    (e.g. a second profile for the same user)
+
+    Raised by services for conflicts detected up front; routes map it to 409.
+    """
+    def __init__(self, message: str = "Resource already exists"):
+        self.message = message
+        super().__init__(self.message)
@@ -0,0 +1,37 @@
+"""
+ASGI middleware
+Written as plain ASGI callables rather than BaseHTTPMiddleware / @app.middleware("http"),
+which wrap every request and response in extra Request/Response objects and tasks.
+Reference: https://www.starlette.io/middleware/#pure-asgi-middleware
+"""
+import sys
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class RequestLogMiddleware:
+    """
+    Log method, path and response status for every HTTP request to stdout.
+
+    Only the http.response.start message is inspected (to read the status code);
+    request and response bodies pass through untouched.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        sys.stdout.write(f"[DEBUG MIDDLEWARE] {scope['method']} {scope['path']}\n")
+        sys.stdout.flush()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                sys.stdout.write(f"[DEBUG MIDDLEWARE] Response: {message['status']}\n")
+                sys.stdout.flush()
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -5,7 +5,7 @@ Reference: https://upstash.com/docs/redis/overall/getstarted
 """
 import httpx
 import logging
-from typing import Optional
+from typing import Dict, List, Optional
 from functools import lru_cache
 
 from app.core.config import settings
@@ -165,4 +165,97 @@ class RedisClient:
         except Exception as e:
             logger.error(f"Failed to delete Redis key {key}: {type(e).__name__}: {e}", exc_info=True)
             return False
-
+    
+    async def hget(self, key: str, field: str) -> Optional[str]:
+        """
+        Get a single field of a hash.
+        
+        Upstash REST API format: POST / with the command as a JSON array in the body
+        (used instead of the path form so arbitrary field names need no escaping)
+        
+        Args:
+            key: Redis hash key
+            field: Field within the hash
+            
+        Returns:
+            Value if found, None otherwise
+        """
+        try:
+            async with httpx.AsyncClient(timeout=5.0) as client:
+                response = await client.post(
+                    self.base_url,
+                    headers={
+                        "Authorization": f"Bearer {self.token}",
+                    },
+                    json=["HGET", key, field],
+                )
+                response.raise_for_status()
+                result = response.json()
+                # Upstash REST API returns {"result": "value"} or {"result": null}
+                return result.get("result") if result else None
+        except Exception as e:
+            logger.error(f"Failed to get Redis hash field {key}[{field}]: {type(e).__name__}: {e}", exc_info=True)
+            return None
+    
+    async def hmget(self, key: str, fields: List[str]) -> List[Optional[str]]:
+        """
+        Get several fields of a hash in one round trip.
+        
+        Upstash REST API format: POST / with the command as a JSON array in the body
+        
+        Args:
+            key: Redis hash key
+            fields: Fields within the hash
+            
+        Returns:
+            One value per field (None where missing); all None on failure
+        """
+        try:
+            async with httpx.AsyncClient(timeout=5.0) as client:
+                response = await client.post(
+                    self.base_url,
+                    headers={
+                        "Authorization": f"Bearer {self.token}",
+                    },
+                    json=["HMGET", key, *fields],
+                )
+                response.raise_for_status()
+                result = response.json()
+                # Upstash REST API returns {"result": ["value", null, ...]}
+                values = result.get("result") if result else None
+                return values if values else [None] * len(fields)
+        except Exception as e:
+            logger.error(f"Failed to get Redis hash fields {key}{fields}: {type(e).__name__}: {e}", exc_info=True)
+            return [None] * len(fields)
+    
+    async def hset_with_expiry(self, key: str, mapping: Dict[str, str], seconds: int) -> bool:
+        """
+        Set hash fields and (re)set the hash's expiration in one round trip.
+        
+        Upstash REST API format: POST /pipeline with a JSON array of commands
+        
+        Args:
+            key: Redis hash key
+            mapping: Fields within the hash and the values to store
+            seconds: Expiration time in seconds for the whole hash
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        fields_and_values = [part for item in mapping.items() for part in item]
+        try:
+            async with httpx.AsyncClient(timeout=5.0) as client:
+                response = await client.post(
+                    f"{self.base_url}/pipeline",
+                    headers={
+                        "Authorization": f"Bearer {self.token}",
+                    },
+                    json=[["HSET", key, *fields_and_values], ["EXPIRE", key, seconds]],
+                )
+                response.raise_for_status()
+                results = response.json()
+                # Upstash returns one {"result": ...} or {"error": ...} entry per command
+                return all("error" not in result for result in results)
+        except Exception as e:
+            logger.error(f"Failed to set Redis hash fields {key}{list(mapping)}: {type(e).__name__}: {e}", exc_info=True)
+            return False
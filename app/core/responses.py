@@ -0,0 +1,115 @@
+"""
+Custom response classes
+Reference: https://fastapi.tiangolo.com/advanced/custom-response/
+"""
+import hashlib
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+import orjson
+from fastapi import Request, Response, status
+
+
+def _orjson_default(obj: Any) -> Any:
+    """
+    Fallback encoder for types orjson doesn't serialize natively.
+
+    datetime, date, UUID, enums and dataclasses are handled by orjson itself;
+    only Decimal (e.g. Numeric columns) needs help.
+    """
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dump_json(content: Any) -> bytes:
+    """Serialize plain data to JSON bytes with the same options used for responses."""
+    return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NAIVE_UTC)
+
+
+class ORJSONResponse(Response):
+    """
+    JSON response rendered with orjson.
+
+    Returning this directly from a route skips FastAPI's response_model
+    re-validation and jsonable_encoder pass, so the content must already be
+    plain, trusted data (dicts/lists built from ORM rows). Rows were validated
+    by the Create/Update schemas on the way in, so re-validating every field
+    of every row on the way out would be wasted work. Routes keep
+    response_model= for the OpenAPI schema.
+
+    Already-encoded bytes (e.g. a cached payload) are passed through as-is.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dump_json(content)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (weak comparison, as RFC 9110 requires).
+
+    Reference: https://www.rfc-editor.org/rfc/rfc9110#field.if-none-match
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque_tag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def not_modified_response(request: Request, etag: str, headers: Dict[str, str]) -> Optional[Response]:
+    """
+    Return an empty 304 response if the request's If-None-Match matches etag, else None.
+
+    For responses whose ETag is derived from something other than the full body
+    (e.g. a streamed list tagged by its rows' IDs and timestamps), so the check
+    can run before any serialization happens.
+
+    Args:
+        request: Current request (read for If-None-Match)
+        etag: ETag of the current representation, including quotes (and W/ if weak)
+        headers: Headers (ETag, Cache-Control) to send with the 304
+    """
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return None
+
+
+def conditional_json_response(
+    request: Request,
+    payload: bytes,
+    cache_control: str = "private, no-cache",
+) -> Response:
+    """
+    Return already-encoded JSON with an ETag, or 304 Not Modified if the client has it.
+
+    The ETag is a hash of the payload itself, so it works the same for bytes
+    served from Redis and freshly serialized ones. With the default
+    "private, no-cache" clients (and no shared caches) keep the body but
+    revalidate on each use; pass e.g. "private, max-age=30, must-revalidate"
+    to let clients reuse it without asking for a while. A matching
+    If-None-Match gets an empty 304.
+
+    Args:
+        request: Current request (read for If-None-Match)
+        payload: JSON body, already encoded
+        cache_control: Cache-Control header value
+
+    Returns:
+        ORJSONResponse with ETag/Cache-Control headers, or an empty 304 response
+    """
+    etag = f'"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+    # Vary: the same URL returns a different body for each signed-in user
+    headers = {"ETag": etag, "Cache-Control": cache_control, "Vary": "Authorization"}
+    not_modified = not_modified_response(request, etag, headers)
+    if not_modified is not None:
+        return not_modified
+    return ORJSONResponse(content=payload, headers=headers)
@@ -8,14 +8,15 @@ from contextlib import asynccontextmanager
 from debug_toolbar.middleware import DebugToolbarMiddleware
 
 
-import sys
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import text
 
 from app.api.v1.api import api_router
 from app.core.config import settings
 from app.core.database import engine
+from app.core.middleware import RequestLogMiddleware
+from app.services.storage import get_storage_service
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +49,13 @@ async def lifespan(app: FastAPI):
     else:
         logger.debug("Skipping database connection check in development mode")
     
+    # Startup: Build the S3 client singleton and warm its presign signer so the
+    # first presigned-url request doesn't pay for boto3's lazy model loading
+    try:
+        get_storage_service().warm_up()
+    except Exception as e:
+        logger.warning(f"Storage service warm-up failed: {e}")
+    
     yield
     
     # Shutdown: Dispose of database connections
@@ -85,15 +93,8 @@ app.add_middleware(
 )
 
 
-# Debug middleware to log all requests
-@app.middleware("http")
-async def debug_middleware(request: Request, call_next):
-    sys.stdout.write(f"[DEBUG MIDDLEWARE] {request.method} {request.url.path}\n")
-    sys.stdout.flush()
-    response = await call_next(request)
-    sys.stdout.write(f"[DEBUG MIDDLEWARE] Response: {response.status_code}\n")
-    sys.stdout.flush()
-    return response
+# Request logging middleware (pure ASGI - no per-request Request/Response wrapping)
+app.add_middleware(RequestLogMiddleware)
 
 
 # Include API routers
@@ -63,6 +63,11 @@ class User(Base):
     last_name: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     is_onboarded: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
+    # Child tables declare ON DELETE CASCADE on user_id, so passive_deletes lets
+    # PostgreSQL remove children when a user is deleted instead of the ORM
+    # lazy-loading every profile/wardrobe item/session and deleting them row by row
+    # Reference: https://docs.sqlalchemy.org/en/21/orm/cascades.html#using-foreign-key-on-delete-cascade-with-orm-relationships
+
     # One-to-one relationship to UserProfile
     # Reference: https://docs.sqlalchemy.org/en/21/orm/basic_relationships.html#one-to-one
     profile: Mapped[Optional["UserProfile"]] = relationship(
@@ -70,18 +75,20 @@ class User(Base):
         back_populates="user",
         uselist=False,
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     # One-to-many relationship to Wardrobe items
     # Reference: https://docs.sqlalchemy.org/en/21/orm/basic_relationships.html#one-to-many
     wardrobe_items: Mapped[list["Wardrobe"]] = relationship(
-        "Wardrobe", back_populates="user", cascade="all, delete-orphan"
+        "Wardrobe", back_populates="user", cascade="all, delete-orphan", passive_deletes=True
     )
 
     virtual_try_on_sessions: Mapped[list["VirtualTryOn"]] = relationship(
         "VirtualTryOn",
         back_populates="user",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     created_at: Mapped[datetime] = mapped_column(
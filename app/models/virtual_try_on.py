@@ -7,7 +7,7 @@ Reference: https://docs.sqlalchemy.org/en/21/orm/declarative_tables.html
 from datetime import datetime
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import JSON, Boolean, DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import JSON, Boolean, DateTime, ForeignKey, Index, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -21,6 +21,13 @@ class VirtualTryOn(Base):
 
     __tablename__ = "virtual_try_on_sessions"
 
+    # Composite index for the session list: WHERE user_id = ? [AND id < cursor]
+    # ORDER BY id DESC is a single index range scan
+    # Reference: https://docs.sqlalchemy.org/en/21/core/constraints.html#indexes
+    __table_args__ = (
+        Index("ix_virtual_try_on_sessions_user_id_id", "user_id", "id"),
+    )
+
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
 
     user_id: Mapped[str] = mapped_column(
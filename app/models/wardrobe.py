@@ -63,6 +63,17 @@ class Wardrobe(Base):
         Index(
             "ix_wardrobe_items_user_category", "user_id", "category"
         ),  # Composite index for common query pattern
+        # The list endpoint orders by id DESC and pages with an id cursor + LIMIT; these
+        # let Postgres walk the index backwards from the cursor and stop after `limit`
+        # rows instead of sorting the user's whole wardrobe on every request
+        Index("ix_wardrobe_items_user_id_id", "user_id", "id"),
+        Index(
+            "ix_wardrobe_items_user_category_status_id",
+            "user_id",
+            "category",
+            "status",
+            "id",
+        ),  # Same, with the category (+ status) filters applied
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
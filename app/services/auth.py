@@ -31,6 +31,7 @@ from app.api.v1.schemas.auth import (
     WorkOsVerifyEmailRequest,
 )
 from app.core.config import settings
+from app.core.exceptions import AlreadyExistsException, TokenExpiredException
 from app.models.user import User
 
 logger = logging.getLogger(__name__)
@@ -44,6 +45,10 @@ class AuthService:
         # Cache JWKS to avoid repeated fetches (cache for 1 hour)
         self._jwks_cache: Optional[dict] = None
         self._jwks_cache_expiry: Optional[float] = None
+        # JWKS URL is derived from the client ID only, and the parsed key set only
+        # changes when the JWKS is refetched - resolve both once instead of per token
+        self._jwks_url: Optional[str] = None
+        self._jwk_set = None
 
     async def _decode_and_validate_token(self, access_token: str) -> dict:
         """
@@ -61,10 +66,10 @@ class AuthService:
         Raises:
             ValueError: If token is invalid, expired, or signature verification fails
         """
-        # Get JWKS URL from WorkOS SDK
-        jwks_url = await asyncio.to_thread(
-            self.workos_client.user_management.get_jwks_url
-        )
+        # Get JWKS URL from WorkOS SDK (computed locally, no network call)
+        if self._jwks_url is None:
+            self._jwks_url = self.workos_client.user_management.get_jwks_url()
+        jwks_url = self._jwks_url
 
         # Fetch JWKS (with caching to avoid repeated API calls)
         current_time = time.time()
@@ -80,13 +85,14 @@ class AuthService:
                 response = await client.get(jwks_url, timeout=10.0)
                 response.raise_for_status()
                 self._jwks_cache = response.json()
+                self._jwk_set = JsonWebKey.import_key_set(self._jwks_cache)
                 # Cache for 1 hour (JWKS keys don't change often)
                 self._jwks_cache_expiry = current_time + 3600
                 jwks_time = (time.time() - jwks_start) * 1000
                 sys.stdout.write(f"[TIMING] JWKS fetch took {jwks_time:.1f}ms\n")
                 sys.stdout.flush()
                 logger.debug(
-                    f"JWKS fetched and cached. Keys: {len(self._jwks_cache.get('keys', []))}"
+                    "JWKS fetched and cached. Keys: %s", len(self._jwks_cache.get('keys', [])),
                 )
         else:
             import sys
@@ -96,13 +102,10 @@ class AuthService:
             )
             sys.stdout.flush()
 
-        # Create JWK set from JWKS
-        jwk_set = JsonWebKey.import_key_set(self._jwks_cache)
-
-        # Verify and decode the JWT
+        # Verify and decode the JWT against the cached JWK set
         claims = jwt.decode(
             access_token,
-            jwk_set,
+            self._jwk_set,
             claims_options={"exp": {"essential": True}, "iat": {"essential": True}},
         )
 
@@ -248,7 +251,8 @@ class AuthService:
             SignupResponse with user info (no tokens - email verification required)
 
         Raises:
-            IntegrityError: If user already exists in database (email conflict)
+            AlreadyExistsException: If user already exists in database (email conflict)
+            IntegrityError: If the database insert hits a constraint (e.g. concurrent signup)
             BadRequestException: If user creation fails in WorkOS (e.g., email already exists)
         """
         # Check if user already exists in database BEFORE creating in WorkOS
@@ -258,17 +262,8 @@ class AuthService:
 
         if existing_user:
             logger.warning(f"User already exists in database: {email}")
-            # Raise IntegrityError to match database constraint violation behavior
             # This will be caught by the route handler and converted to 409 Conflict
-            from sqlalchemy.exc import IntegrityError as SQLIntegrityError
-
-            raise SQLIntegrityError(
-                statement="INSERT INTO users",
-                params=None,
-                orig=Exception(
-                    'duplicate key value violates unique constraint "ix_users_email"'
-                ),
-            )
+            raise AlreadyExistsException(f"User already exists: {email}")
 
         # Create user in WorkOS (only if not in database)
         create_user_payload = {
@@ -518,13 +513,14 @@ class AuthService:
             - iat: Issued at timestamp
 
         Raises:
-            ValueError: If token is invalid, expired, or signature verification fails
+            TokenExpiredException: If token is expired or has been revoked
+            ValueError: If token is invalid or signature verification fails
         """
         try:
             # Decode and validate token using shared helper method
             claims = await self._decode_and_validate_token(access_token)
 
-            logger.debug(f"Token verified successfully. User: {claims.get('sub')}")
+            logger.debug("Token verified successfully. User: %s", claims.get('sub'))
 
             # Check token blacklist before returning
             # This allows immediate invalidation of tokens after logout
@@ -543,7 +539,7 @@ class AuthService:
                 if await is_token_blacklisted(jti):
                     logger.warning(f"Token is blacklisted: {jti}")
                     # Return "expired" message for security - don't reveal token was revoked
-                    raise ValueError("Token has expired") from None
+                    raise TokenExpiredException() from None
 
             # Extract user information from verified token
             # Reference: https://workos.com/docs/reference/authkit/session-tokens/access-token
@@ -560,9 +556,12 @@ class AuthService:
                 "iat": claims.get("iat"),
             }
 
+        except TokenExpiredException:
+            # Raised above for blacklisted tokens - pass through unchanged
+            raise
         except ExpiredTokenError:
             logger.warning("Token has expired")
-            raise ValueError("Token has expired") from None
+            raise TokenExpiredException() from None
         except BadSignatureError:
             logger.warning("Invalid token signature")
             raise ValueError(
@@ -3,14 +3,16 @@ Task service layer
 Business logic for task operations
 Reference: https://fastapi.tiangolo.com/tutorial/sql-databases/
 """
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
-from sqlalchemy.orm import selectinload
+from sqlalchemy import delete, lambda_stmt, select, update
 
 from app.models.task import Task
 from app.api.v1.schemas.task import TaskCreate, TaskUpdate
 
+# Rows fetched per round-trip from the server-side cursor in stream_tasks
+TASK_STREAM_BATCH_SIZE = 100
+
 
 class TaskService:
     """
@@ -40,35 +42,79 @@ class TaskService:
         db: AsyncSession,
         skip: int = 0,
         limit: int = 100,
-        completed: Optional[bool] = None
+        completed: Optional[bool] = None,
+        before_id: Optional[int] = None
     ) -> List[Task]:
         """
         Retrieve multiple tasks with optional filtering
         
         Args:
             db: Database session
-            skip: Number of records to skip (for pagination)
+            skip: Number of records to skip (for pagination; ignored with before_id)
             limit: Maximum number of records to return
             completed: Optional filter by completion status
+            before_id: Keyset cursor - only return tasks with a smaller ID
+                (the last ID of the previous page)
             
         Returns:
             List of Task objects
         """
-        query = select(Task)
+        # Build the query as a lambda statement: SQLAlchemy caches each lambda's
+        # construction and compiled SQL by its code location, and turns the closure
+        # variables (completed, before_id, skip, limit) into bound parameters, so
+        # repeat calls skip rebuilding the Select and its cache key
+        # Reference: https://docs.sqlalchemy.org/en/20/core/connections.html#using-lambdas-to-add-significant-speed-gains-to-statement-production
+        query = lambda_stmt(lambda: select(Task))
         
         # Apply filter if provided
         if completed is not None:
-            query = query.where(Task.completed == completed)
-        
+            query += lambda s: s.where(Task.completed == completed)
+        
+        # Keyset (cursor) pagination: seek straight to the page through the primary key
+        # index instead of scanning and discarding `skip` rows with OFFSET
+        # Reference: https://use-the-index-luke.com/no-offset
+        if before_id is not None:
+            query += lambda s: s.where(Task.id < before_id)
+        elif skip:
+            query += lambda s: s.offset(skip)
+        
+        # Order by ID (newest first) - IDs follow insertion order like created_at,
+        # but are unique and indexed, which keeps the cursor stable
         # Apply pagination
-        query = query.offset(skip).limit(limit)
-        
-        # Order by creation date (newest first)
-        query = query.order_by(Task.created_at.desc())
+        query += lambda s: s.order_by(Task.id.desc()).limit(limit)
         
         result = await db.execute(query)
         return list(result.scalars().all())
     
+    @staticmethod
+    async def stream_tasks(
+        db: AsyncSession,
+        completed: Optional[bool] = None
+    ) -> AsyncIterator[List[Task]]:
+        """
+        Stream all tasks (newest first) in batches from a server-side cursor
+        
+        Unlike get_tasks, the full result set is never held in memory: rows are
+        fetched TASK_STREAM_BATCH_SIZE at a time as the caller consumes them.
+        
+        Args:
+            db: Database session (must stay open until iteration finishes)
+            completed: Optional filter by completion status
+            
+        Yields:
+            Lists of up to TASK_STREAM_BATCH_SIZE Task objects
+        """
+        # Reference: https://docs.sqlalchemy.org/en/20/orm/queryguide/api.html#fetching-large-result-sets-with-yield-per
+        query = select(Task).order_by(Task.id.desc())
+        if completed is not None:
+            query = query.where(Task.completed == completed)
+        
+        result = await db.stream_scalars(
+            query.execution_options(yield_per=TASK_STREAM_BATCH_SIZE)
+        )
+        async for batch in result.partitions():
+            yield batch
+    
     @staticmethod
     async def create_task(db: AsyncSession, task_data: TaskCreate) -> Task:
         """
@@ -122,22 +168,19 @@ class TaskService:
         Returns:
             Updated Task object if found, None otherwise
         """
-        # Get existing task
-        task = await TaskService.get_task(db, task_id)
-        if not task:
-            return None
-        
         # Update only provided fields
         update_data = task_data.model_dump(exclude_unset=True)  # Only include set fields
-        for field, value in update_data.items():
-            setattr(task, field, value)
+        if not update_data:
+            return await TaskService.get_task(db, task_id)
         
+        # Single UPDATE ... RETURNING instead of SELECT + UPDATE: no returned row means
+        # the task doesn't exist, and the new updated_at comes back with the row
         # Don't commit here - let the get_db() dependency handle commit/rollback
-        await db.flush()  # Flush changes to database (without committing)
-        # Don't refresh here - timestamps will be available after commit
-        # In serverless, refreshing before commit can cause connection issues
-        
-        return task
+        # Reference: https://docs.sqlalchemy.org/en/20/orm/queryguide/dml.html#orm-update-and-delete-with-custom-where-criteria
+        result = await db.execute(
+            update(Task).where(Task.id == task_id).values(**update_data).returning(Task)
+        )
+        return result.scalar_one_or_none()
     
     @staticmethod
     async def delete_task(db: AsyncSession, task_id: int) -> bool:
@@ -151,15 +194,10 @@ class TaskService:
         Returns:
             True if task was deleted, False if not found
         """
-        # Get task first
-        task = await TaskService.get_task(db, task_id)
-        if not task:
-            return False
-        
-        # Delete task
+        # Single DELETE ... RETURNING instead of SELECT + DELETE: no returned row
+        # means the task doesn't exist
         # Don't commit here - let the get_db() dependency handle commit/rollback
-        await db.delete(task)
-        # No need to flush for delete - commit will handle it
-        
-        return True
-
+        result = await db.execute(
+            delete(Task).where(Task.id == task_id).returning(Task.id)
+        )
+        return result.scalar_one_or_none() is not None
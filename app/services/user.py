@@ -1,18 +1,37 @@
 import asyncio
 import logging
-import sys
+from functools import lru_cache
 from typing import List, Optional
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from workos import WorkOSClient
 from datetime import datetime, timezone
 from app.core.config import settings
+from app.core.database import is_foreign_key_violation
+from app.core.exceptions import AlreadyExistsException
 from app.models.user import User, UserProfile
 from app.api.v1.schemas.user import UserCreate, UserProfileCreate, UserProfileUpdate, UserUpdate
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache()
+def get_user_service() -> "UserService":
+    """
+    Get a singleton UserService instance.
+
+    The service holds no per-request state (the session is passed to each
+    method), so one instance - and one WorkOSClient with its HTTP connection
+    pool - is shared instead of being constructed on every request.
+
+    Reference: https://docs.python.org/3/library/functools.html#functools.lru_cache
+    """
+    return UserService()
+
+
 class UserService:
     def __init__(self):
         self.workos_client = WorkOSClient(
@@ -24,6 +43,26 @@ class UserService:
         result = await db.execute(select(User).where(User.id == user_id))
         return result.scalar_one_or_none()
 
+    async def get_user_with_profile(self, db: AsyncSession, user_id: str) -> Optional[User]:
+        """
+        Get a user with their profile eagerly loaded in the same query.
+
+        The profile is one-to-one, so a LEFT OUTER JOIN returns both in a single
+        roundtrip (user.profile is None when no profile exists).
+        Reference: https://docs.sqlalchemy.org/en/21/orm/queryguide/relationships.html#joined-eager-loading
+
+        Args:
+            db: Database session
+            user_id: ID of the user
+
+        Returns:
+            User with .profile loaded if found, None otherwise
+        """
+        result = await db.execute(
+            select(User).options(joinedload(User.profile)).where(User.id == user_id)
+        )
+        return result.scalar_one_or_none()
+
     async def get_users(self, db: AsyncSession, skip: int = 0, limit: int = 100) -> List[User]:
         result = await db.execute(select(User).offset(skip).limit(limit))
         return list(result.scalars().all())
@@ -106,8 +145,11 @@ class UserService:
 
     
     async def delete_user(self, db: AsyncSession, user_id: str) -> bool:
-        existing_user = await self.get_user(db, user_id)
-        if not existing_user:
+        # Delete in the database first with a single DELETE ... RETURNING (no row means
+        # no such user). Child rows go with it via ON DELETE CASCADE, and if the WorkOS
+        # call below fails, get_db() rolls this back.
+        result = await db.execute(delete(User).where(User.id == user_id).returning(User.id))
+        if result.scalar_one_or_none() is None:
             return False
         
         # Offload synchronous WorkOS call to thread pool to avoid blocking event loop
@@ -115,8 +157,6 @@ class UserService:
             self.workos_client.user_management.delete_user,
             user_id=user_id
         )
-
-        await db.delete(existing_user)
         return True
 
     async def create_user_profile(
@@ -129,10 +169,10 @@ class UserService:
         Create a user profile for a given user.
         
         Edge cases handled:
-        - Validates user exists before creating profile
-        - Prevents duplicate profile creation (unique constraint)
+        - Reports a missing user (foreign key violation) as ValueError
+        - Prevents duplicate profile creation (unique constraint) without raising
+          a database error - see INSERT ... ON CONFLICT below
         - Only sets fields that were explicitly provided (exclude_unset=True)
-        - Handles database integrity errors gracefully
         
         Args:
             db: Database session
@@ -144,65 +184,41 @@ class UserService:
             
         Raises:
             ValueError: If user doesn't exist
-            IntegrityError: If profile already exists for this user
+            AlreadyExistsException: If profile already exists for this user
         """
-        # Edge case 1: Validate user exists before creating profile
-        # Prevents foreign key constraint violation
-        user = await self.get_user(db, user_id)
-        if not user:
-            logger.warning(f"Attempted to create profile for non-existent user: {user_id}")
-            raise ValueError(f"User with ID '{user_id}' does not exist")
-        
-        # Edge case 2: Check if profile already exists
-        # Prevents unique constraint violation at database level
-        result = await db.execute(
-            select(UserProfile).where(UserProfile.user_id == user_id)
-        )
-        existing_profile = result.scalar_one_or_none()
-        if existing_profile:
-            logger.warning(f"Profile already exists for user: {user_id}")
-            raise IntegrityError(
-                statement="INSERT INTO user_profiles",
-                params=None,
-                orig=Exception(
-                    f"duplicate key value violates unique constraint "
-                    f"\"uq_user_profiles_user_id\" - profile already exists for user {user_id}"
-                )
-            )
-        
-        # Edge case 3: Only include fields that were explicitly set
+        # Edge case 1: Only include fields that were explicitly set
         # Prevents overwriting with None values for omitted fields
         # Reference: https://docs.pydantic.dev/latest/api/standard_library/#pydantic.BaseModel.model_dump
         profile_data = user_profile_data.model_dump(exclude_unset=True)
         
-        # Edge case 4: Create profile with validated data
-        # Enums are already validated by Pydantic schema
-        user_profile = UserProfile(
-            user_id=user_id,
-            **profile_data
+        # Edge case 2: Existing profile (including one created by a concurrent request)
+        # INSERT ... ON CONFLICT DO NOTHING RETURNING does the existence check and the
+        # insert in one round-trip: no row comes back when the user already has a
+        # profile, so there's no IntegrityError to raise, catch and roll back from.
+        # RETURNING also loads the server-generated id and timestamps.
+        # Reference: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#insert-on-conflict-upsert
+        stmt = (
+            pg_insert(UserProfile)
+            .values(user_id=user_id, **profile_data)
+            .on_conflict_do_nothing(index_elements=[UserProfile.user_id])
+            .returning(UserProfile)
         )
-        
-        db.add(user_profile)
-        
+        # Edge case 3: Missing user - let the user_id foreign key catch it instead of
+        # a separate SELECT beforehand, so creating a profile is a single round-trip
         try:
-            await db.flush()
-            logger.info(f"Created profile for user: {user_id}")
-            return user_profile
+            result = await db.execute(stmt)
         except IntegrityError as e:
-            # Edge case 5: Handle race condition - profile created between check and insert
-            # This can happen in concurrent requests
-            error_str = str(e.orig) if hasattr(e, 'orig') else str(e)
-            if "uq_user_profiles_user_id" in error_str or "unique constraint" in error_str.lower():
-                logger.warning(f"Profile creation race condition detected for user: {user_id}")
-                # Fetch the existing profile that was just created
-                result = await db.execute(
-                    select(UserProfile).where(UserProfile.user_id == user_id)
-                )
-                existing_profile = result.scalar_one_or_none()
-                if existing_profile:
-                    return existing_profile
-            # Re-raise if it's a different integrity error
-            raise
+            if not is_foreign_key_violation(e):
+                raise
+            logger.warning("Attempted to create profile for non-existent user: %s", user_id)
+            raise ValueError(f"User with ID '{user_id}' does not exist") from e
+        user_profile = result.scalar_one_or_none()
+        if user_profile is None:
+            logger.warning("Profile already exists for user: %s", user_id)
+            raise AlreadyExistsException(f"Profile already exists for user {user_id}")
+        
+        logger.info("Created profile for user: %s", user_id)
+        return user_profile
 
     async def get_user_profile(self, db: AsyncSession, user_id: str) -> Optional[UserProfile]:
         """
@@ -215,36 +231,10 @@ class UserService:
         Returns:
             UserProfile if found, None otherwise
         """
-        sys.stdout.write(f"[DEBUG] get_user_profile SERVICE CALLED with user_id: '{user_id}'\n")
-        sys.stdout.flush()
-        sys.stderr.write(f"[DEBUG STDERR] get_user_profile SERVICE CALLED with user_id: '{user_id}'\n")
-        sys.stderr.flush()
-        logger.error(f"[DEBUG LOGGER] Searching for profile with user_id: '{user_id}' (type: {type(user_id)}, length: {len(user_id)})")
         result = await db.execute(select(UserProfile).where(UserProfile.user_id == user_id))
         user_profile = result.scalar_one_or_none()
-        if user_profile:
-            logger.error(f"[DEBUG] Found profile: id={user_profile.id}, user_id='{user_profile.user_id}' (type: {type(user_profile.user_id)}, length: {len(user_profile.user_id)})")
-            sys.stderr.write(f"[DEBUG] Found profile: id={user_profile.id}, user_id='{user_profile.user_id}'\n")
-            sys.stderr.flush()
-        else:
-            logger.error(f"[DEBUG] No profile found for user_id: '{user_id}'")
-            sys.stderr.write(f"[DEBUG] No profile found for user_id: '{user_id}'\n")
-            sys.stderr.flush()
-            # Also check what user_ids exist in the database
-            all_profiles = await db.execute(select(UserProfile))
-            existing_user_ids = [p.user_id for p in all_profiles.scalars().all()]
-            logger.error(f"[DEBUG] Existing user_ids in database: {existing_user_ids}")
-            sys.stderr.write(f"[DEBUG] Existing user_ids in database: {existing_user_ids}\n")
-            sys.stderr.flush()
-            logger.error(f"[DEBUG] Comparison check:")
-            for existing_id in existing_user_ids:
-                match = user_id == existing_id
-                repr_match = repr(user_id) == repr(existing_id)
-                logger.error(f"  - '{user_id}' == '{existing_id}'? {match}")
-                logger.error(f"  - repr('{user_id}') == repr('{existing_id}')? {repr_match}")
-                sys.stderr.write(f"  - '{user_id}' == '{existing_id}'? {match}\n")
-                sys.stderr.write(f"  - repr('{user_id}') == repr('{existing_id}')? {repr_match}\n")
-                sys.stderr.flush()
+        if user_profile is None:
+            logger.debug("No profile found for user: %s", user_id)
         return user_profile
 
     async def update_user_profile(
@@ -264,34 +254,32 @@ class UserService:
         Returns:
             Updated UserProfile if found, None otherwise
         """
-        existing_user_profile = await self.get_user_profile(db, user_id)
-        if not existing_user_profile:
-            return None
-
         # Get only fields that were explicitly set (exclude_unset=True)
         # This prevents overwriting with None values for omitted fields
         # Reference: https://docs.pydantic.dev/latest/api/standard_library/#pydantic.BaseModel.model_dump
         update_data = user_profile_data.model_dump(exclude_unset=True)
         
-        # Early return if no fields to update
+        # Nothing to update - just return the current profile (or None if missing)
         if not update_data:
-            return existing_user_profile
+            return await self.get_user_profile(db, user_id)
         
-        # Update the database model with all update data
-        # Use setattr loop (SQLAlchemy models don't have .update() method)
-        for field, value in update_data.items():
-            setattr(existing_user_profile, field, value)
-
+        # Single UPDATE ... RETURNING instead of SELECT + UPDATE: no returned row means
+        # the user has no profile. RETURNING also brings back the new updated_at
+        # (onupdate=func.now()), so nothing needs to be refreshed afterwards.
         # Don't commit here - let the get_db() dependency handle commit/rollback
-        await db.flush()  # Flush changes to database (without committing)
-        # Don't refresh here - timestamps will be available after commit
-        # In serverless, refreshing before commit can cause connection issues
-        
-        # Manually set updated_at since we can't reliably refresh in serverless environments
-        # (onupdate=func.now() may not work reliably in serverless)
-        existing_user_profile.updated_at = datetime.now(timezone.utc)
+        # Reference: https://docs.sqlalchemy.org/en/20/orm/queryguide/dml.html#orm-update-and-delete-with-custom-where-criteria
+        stmt = (
+            update(UserProfile)
+            .where(UserProfile.user_id == user_id)
+            .values(**update_data)
+            .returning(UserProfile)
+        )
+        result = await db.execute(stmt)
+        existing_user_profile = result.scalar_one_or_none()
+        if not existing_user_profile:
+            return None
 
-        logger.info(f"Profile updated for user: {user_id}")
+        logger.info("Profile updated for user: %s", user_id)
         return existing_user_profile
 
     async def delete_user_profile(self, db: AsyncSession, user_id: str) -> bool:
@@ -305,24 +293,15 @@ class UserService:
         Returns:
             True if deleted, False if not found
         """
-        existing_user_profile = await self.get_user_profile(db, user_id)
-        if not existing_user_profile:
-            logger.debug(f"Profile not found for user: {user_id}")
-            return False
-        
-        # Delete profile using SQLAlchemy delete statement
-        # Use delete() statement for reliable async deletion
+        # Single DELETE ... RETURNING instead of SELECT + DELETE: no returned row
+        # means there was no profile to delete
         # Reference: https://docs.sqlalchemy.org/en/20/core/dml.html#sqlalchemy.sql.expression.delete
-        profile_id = existing_user_profile.id
-        stmt = delete(UserProfile).where(UserProfile.id == profile_id)
+        stmt = delete(UserProfile).where(UserProfile.user_id == user_id).returning(UserProfile.id)
         result = await db.execute(stmt)
-        await db.flush()  # Flush to execute the delete immediately
-        
-        # Check if any rows were deleted
-        rows_deleted = result.rowcount
-        if rows_deleted == 0:
-            logger.warning(f"No rows deleted for profile_id: {profile_id}, user_id: {user_id}")
+        profile_id = result.scalar_one_or_none()
+        if profile_id is None:
+            logger.debug("Profile not found for user: %s", user_id)
             return False
         
-        logger.info(f"Profile deleted successfully for user: {user_id}, profile_id: {profile_id} (rows_deleted: {rows_deleted})")
-        return True
\ No newline at end of file
+        logger.info("Profile deleted successfully for user: %s, profile_id: %s", user_id, profile_id)
+        return True
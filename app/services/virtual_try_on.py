@@ -4,9 +4,10 @@ Service for Virtual Try-On sessions.
 
 import logging
 from datetime import datetime, timezone
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import RowMapping, bindparam, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.schemas.virtual_try_on import VirtualTryOnCreate
@@ -14,6 +15,34 @@ from app.models.virtual_try_on import VirtualTryOn
 
 logger = logging.getLogger(__name__)
 
+# Session list queries, built once at import time and reused with bound parameters
+# so each request skips constructing the Select and its cache key from scratch.
+# Selects plain columns (every column is part of the response) rather than the
+# entity, so listing doesn't build ORM objects or identity-map entries per row.
+# Pages are keyset-paginated on id (newest first): the next page starts below the
+# last ID seen instead of at a growing OFFSET
+# Reference: https://use-the-index-luke.com/no-offset
+_LIST_SESSIONS_STMT = (
+    select(*VirtualTryOn.__table__.columns)
+    .where(VirtualTryOn.user_id == bindparam("user_id"))
+    .order_by(VirtualTryOn.id.desc())
+    .limit(bindparam("limit"))
+)
+_LIST_SESSIONS_BEFORE_STMT = _LIST_SESSIONS_STMT.where(
+    VirtualTryOn.id < bindparam("before_id")
+)
+
+
+@lru_cache()
+def get_virtual_try_on_service() -> "VirtualTryOnService":
+    """
+    Get a singleton VirtualTryOnService instance.
+
+    The service is stateless (the session is passed to each method), so one
+    instance is shared instead of being allocated on every request.
+    """
+    return VirtualTryOnService()
+
 
 class VirtualTryOnService:
     """Business logic for virtual try-on sessions."""
@@ -48,6 +77,39 @@ class VirtualTryOnService:
         )
         return session
 
+    async def create_sessions_bulk(
+        self,
+        db: AsyncSession,
+        user_id: str,
+        sessions_data: List[VirtualTryOnCreate],
+    ) -> Sequence[RowMapping]:
+        """
+        Persist several try-on sessions for a user with a single INSERT ... RETURNING.
+
+        Executed with a parameter list, which SQLAlchemy's "insertmanyvalues" mode
+        sends as one multi-row INSERT per batch of up to 1000 rows.
+        Rows are returned as column mappings (like list_sessions) in payload order,
+        with IDs and server-generated timestamps filled in.
+        Reference: https://docs.sqlalchemy.org/en/20/core/connections.html#insert-many-values-behavior-for-insert-statements
+
+        Args:
+            db: AsyncSession
+            user_id: WorkOS user ID
+            sessions_data: Payloads describing the try-on sessions
+        """
+
+        table = VirtualTryOn.__table__
+        result = await db.execute(
+            insert(table).returning(*table.columns, sort_by_parameter_order=True),
+            [{**data.model_dump(), "user_id": user_id} for data in sessions_data],
+        )
+        sessions = result.mappings().all()
+
+        logger.info(
+            "Created %d virtual try-on sessions for user %s", len(sessions), user_id
+        )
+        return sessions
+
     async def get_session(
         self,
         db: AsyncSession,
@@ -69,13 +131,25 @@ class VirtualTryOnService:
         db: AsyncSession,
         user_id: str,
         limit: int = 50,
-    ) -> List[VirtualTryOn]:
-        """List recent sessions for a user."""
+        before_id: Optional[int] = None,
+    ) -> Sequence[RowMapping]:
+        """
+        List recent sessions for a user as column mappings (one per session).
 
-        result = await db.execute(
-            select(VirtualTryOn)
-            .where(VirtualTryOn.user_id == user_id)
-            .order_by(VirtualTryOn.created_at.desc())
-            .limit(limit)
-        )
-        return list(result.scalars().all())
+        Args:
+            db: AsyncSession
+            user_id: Owner of the sessions
+            limit: Maximum number of sessions to return
+            before_id: Only return sessions older than this session ID (keyset cursor)
+        """
+
+        if before_id is None:
+            result = await db.execute(
+                _LIST_SESSIONS_STMT, {"user_id": user_id, "limit": limit}
+            )
+        else:
+            result = await db.execute(
+                _LIST_SESSIONS_BEFORE_STMT,
+                {"user_id": user_id, "limit": limit, "before_id": before_id},
+            )
+        return result.mappings().all()
@@ -6,18 +6,33 @@ Reference: https://docs.sqlalchemy.org/en/21/orm/queryguide/
 import logging
 import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import List, Optional
 
-from sqlalchemy import select, update
+from sqlalchemy import delete, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.schemas.wardrobe import WardrobeCreate, WardrobeUpdate
+from app.core.database import is_foreign_key_violation
 from app.models.wardrobe import ItemStatus, Wardrobe
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache()
+def get_wardrobe_service() -> "WardrobeService":
+    """
+    Get a singleton WardrobeService instance.
+
+    The service holds no per-request state (the session is passed to each
+    method), so one instance is shared instead of constructing it per request.
+
+    Reference: https://docs.python.org/3/library/functools.html#functools.lru_cache
+    """
+    return WardrobeService()
+
+
 class WardrobeService:
     """Service for managing wardrobe items"""
 
@@ -52,6 +67,7 @@ class WardrobeService:
         status: Optional[ItemStatus] = None,
         skip: int = 0,
         limit: int = 100,
+        before_id: Optional[int] = None,
     ) -> List[Wardrobe]:
         """
         Get wardrobe items for a user with optional filtering.
@@ -61,8 +77,10 @@ class WardrobeService:
             user_id: User ID (users can only access their own items)
             category: Optional category filter
             status: Optional status filter
-            skip: Number of items to skip (for pagination)
+            skip: Number of items to skip (for pagination; ignored with before_id)
             limit: Maximum number of items to return
+            before_id: Keyset cursor - only return items with a smaller ID
+                (the last ID of the previous page)
 
         Returns:
             List of wardrobe items
@@ -76,7 +94,17 @@ class WardrobeService:
             # Convert enum to string value for database comparison
             query = query.where(Wardrobe.status == status.value)
 
-        query = query.order_by(Wardrobe.created_at.desc()).offset(skip).limit(limit)
+        # Keyset (cursor) pagination: seek straight to the page through the
+        # (user_id, ..., id) indexes instead of scanning and discarding `skip` rows
+        # Reference: https://use-the-index-luke.com/no-offset
+        if before_id is not None:
+            query = query.where(Wardrobe.id < before_id)
+        elif skip:
+            query = query.offset(skip)
+
+        # Order by ID (newest first) - IDs follow insertion order like created_at,
+        # but are unique, which keeps the cursor stable
+        query = query.order_by(Wardrobe.id.desc()).limit(limit)
 
         result = await db.execute(query)
         items = list(result.scalars().all())
@@ -118,11 +146,17 @@ class WardrobeService:
         try:
             await db.flush()
             logger.info(
-                f"Created wardrobe item '{wardrobe_item.title}' for user: {user_id}"
+                "Created wardrobe item '%s' for user: %s", wardrobe_item.title, user_id,
             )
             return wardrobe_item
         except IntegrityError as e:
             await db.rollback()
+            if is_foreign_key_violation(e):
+                # A client-side problem (no users row yet), not a bug - no traceback
+                logger.warning(
+                    "Attempted to create wardrobe item for non-existent user: %s", user_id
+                )
+                raise ValueError(f"User with ID '{user_id}' does not exist") from e
             logger.error(
                 "Failed to create wardrobe item due to database error", exc_info=True
             )
@@ -169,7 +203,7 @@ class WardrobeService:
 
         try:
             await db.flush()
-            logger.info(f"Updated wardrobe item {item_id} for user: {user_id}")
+            logger.info("Updated wardrobe item %s for user: %s", item_id, user_id)
             return wardrobe_item
         except IntegrityError as e:
             await db.rollback()
@@ -191,15 +225,22 @@ class WardrobeService:
             item_id: Item ID
             user_id: User ID (for authorization - users can only delete their own items)
 
+        Issues a single DELETE ... RETURNING scoped to the owner instead of
+        loading the row first, so the delete costs one round-trip.
+
         Returns:
             True if deleted, False if not found
         """
-        wardrobe_item = await self.get_wardrobe_item(db, item_id, user_id)
-        if not wardrobe_item:
+        stmt = (
+            delete(Wardrobe)
+            .where(Wardrobe.id == item_id, Wardrobe.user_id == user_id)
+            .returning(Wardrobe.id)
+        )
+        result = await db.execute(stmt)
+        if result.scalar_one_or_none() is None:
             return False
 
-        await db.delete(wardrobe_item)
-        logger.info(f"Deleted wardrobe item {item_id} for user: {user_id}")
+        logger.info("Deleted wardrobe item %s for user: %s", item_id, user_id)
         return True
 
     async def mark_item_worn(
@@ -236,7 +277,6 @@ class WardrobeService:
 
         try:
             result = await db.execute(stmt)
-            await db.flush()
 
             wardrobe_item = result.scalar_one_or_none()
             if not wardrobe_item:
@@ -244,7 +284,7 @@ class WardrobeService:
 
             # Pydantic will automatically convert status string to ItemStatus enum
             # when serializing with from_attributes=True
-            logger.info(f"Marked wardrobe item {item_id} as worn for user: {user_id}")
+            logger.info("Marked wardrobe item %s as worn for user: %s", item_id, user_id)
             return wardrobe_item
         except IntegrityError as e:
             await db.rollback()